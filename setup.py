@@ -12,9 +12,11 @@ INSTALL_REQUIREMENTS = [
     'clang~=14.0',
     'llvmlite~=0.39.0',
     'libclang~=14.0.1',
+    'orjson~=3.8.3',
     'python-decouple~=3.6',
     'requests~=2.28.1',
     'typing-extensions~=4.3.0',
+    'urllib3>=1.26',
 ]
 UTIL_NAME = os.getenv('UTIL_NAME')
 UTIL_VERSION = os.getenv('UTIL_VERSION')
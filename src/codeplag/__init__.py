@@ -1,7 +1,7 @@
-from typing import Literal
+from typing import List, Literal, Optional
 
 
-def main() -> Literal[0, 1, 2]:
+def main(argv: Optional[List[str]] = None) -> Literal[0, 1, 2]:
     import argcomplete
     import pandas as pd
 
@@ -16,7 +16,7 @@ def main() -> Literal[0, 1, 2]:
 
     cli = CodeplagCLI()
     argcomplete.autocomplete(cli)
-    parsed_args = vars(cli.parse_args())
+    parsed_args = vars(cli.parse_args(argv))
 
     codeplag_util = CodeplagEngine(logger, parsed_args)
     try:
@@ -0,0 +1,283 @@
+"""
+This module consist the on-disk cache of the works features, which allows
+to skip parsing of the source code that was already processed.
+"""
+import functools
+import hashlib
+import marshal
+import os
+import platform
+import shutil
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+from codeplag.consts import AST_CACHE_PATH, UTIL_VERSION
+from codeplag.types import ASTFeatures, Extension, NodeCodePlace, NodeStructurePlace
+
+# Must be increased on every change of the layout of the serialized features
+CACHE_FORMAT_VERSION = 1
+# The least recently used entries are removed above this size in bytes
+CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def get_parser_version(extension: Extension) -> str:
+    """Returns the version of the parser of the programming language.
+
+    Args:
+        extension: Extension responsible for the analyzed programming language.
+
+    Returns:
+        The version of the libclang package for C++, otherwise
+        the interpreter version.
+    """
+
+    if extension != 'cpp':
+        return platform.python_version()
+
+    try:
+        return version('libclang')
+    except PackageNotFoundError:
+        return ''
+
+
+def get_cache_key(
+    source: bytes,
+    extension: Extension,
+    compile_args: Sequence[Union[str, bytes]] = ()
+) -> str:
+    """Returns the key of the cached features of the source code.
+
+    Args:
+        source: Raw source code.
+        extension: Extension responsible for the analyzed programming language.
+        compile_args: Arguments with which the source code is parsed.
+
+    Returns:
+        SHA-256 digest of the source code, the util version,
+        the interpreter version, the version of the parser and
+        the compile arguments.
+    """
+
+    hasher = hashlib.sha256()
+    parts = (
+        UTIL_VERSION,
+        extension,
+        platform.python_version(),
+        get_parser_version(extension),
+    )
+    for part in parts:
+        hasher.update(part.encode('utf-8'))
+        hasher.update(b'\0')
+    for arg in compile_args:
+        hasher.update(arg if isinstance(arg, bytes) else arg.encode('utf-8'))
+        hasher.update(b'\0')
+    hasher.update(source)
+
+    return hasher.hexdigest()
+
+
+def get_cache_dir() -> Path:
+    # The entries of every format are stored in their own directory,
+    # so the entries of the previous formats are dropped as a whole
+    return AST_CACHE_PATH / f'v{CACHE_FORMAT_VERSION}'
+
+
+def get_cache_file(
+    source: bytes,
+    extension: Extension,
+    compile_args: Sequence[Union[str, bytes]] = ()
+) -> Path:
+    return get_cache_dir() / f'{get_cache_key(source, extension, compile_args)}.bin'
+
+
+def read_source(filepath: Path) -> Optional[bytes]:
+    try:
+        return filepath.read_bytes()
+    except OSError:
+        return None
+
+
+def serialize_features(features: ASTFeatures) -> bytes:
+    """Serializes features without the file path with marshal.
+
+    Args:
+        features: Features extracted from the source code.
+
+    Returns:
+        The version of the format followed by the marshalled tuple of
+        the features fields, which consist only of builtin types.
+    """
+
+    fields = (
+        features.count_of_nodes,
+        features.head_nodes,
+        dict(features.operators),
+        dict(features.keywords),
+        dict(features.literals),
+        features.unodes,
+        features.from_num,
+        features.count_unodes,
+        tuple(map(tuple, features.structure)),
+        features.tokens,
+        tuple(map(tuple, features.tokens_pos)),
+    )
+
+    return bytes((CACHE_FORMAT_VERSION,)) + marshal.dumps(fields)
+
+
+def deserialize_features(
+    data: bytes,
+    filepath: Union[Path, str]
+) -> Optional[ASTFeatures]:
+    """Restores features serialized by serialize_features.
+
+    Args:
+        data: Serialized features.
+        filepath: Path to the work which will be set to the features.
+
+    Returns:
+        The features or None if the data is broken or has another version
+        of the format.
+    """
+
+    if not data or data[0] != CACHE_FORMAT_VERSION:
+        return None
+
+    try:
+        (
+            count_of_nodes, head_nodes, operators, keywords, literals,
+            unodes, from_num, count_unodes, structure, tokens, tokens_pos
+        ) = marshal.loads(data[1:])
+        features = ASTFeatures(filepath)
+        features.operators.update(operators)
+        features.keywords.update(keywords)
+        features.literals.update(literals)
+        features.structure = [NodeStructurePlace(*node) for node in structure]
+        features.tokens_pos = [NodeCodePlace(*place) for place in tokens_pos]
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    features.count_of_nodes = count_of_nodes
+    features.head_nodes = head_nodes
+    features.unodes = unodes
+    features.from_num = from_num
+    features.count_unodes = count_unodes
+    features.tokens = tokens
+
+    return features
+
+
+def load_features(
+    source: bytes,
+    extension: Extension,
+    filepath: Union[Path, str],
+    compile_args: Sequence[Union[str, bytes]] = ()
+) -> Optional[ASTFeatures]:
+    """Loads cached features of the source code.
+
+    Args:
+        source: Raw source code.
+        extension: Extension responsible for the analyzed programming language.
+        filepath: Path to the work which will be set to the loaded features.
+        compile_args: Arguments with which the source code is parsed.
+
+    Returns:
+        The features if they were cached earlier, otherwise None.
+    """
+
+    cache_file = get_cache_file(source, extension, compile_args)
+    try:
+        data = cache_file.read_bytes()
+        # Marks the entry as recently used for prune_cache
+        os.utime(cache_file)
+    except OSError:
+        return None
+
+    return deserialize_features(data, filepath)
+
+
+def save_features(
+    source: bytes,
+    extension: Extension,
+    features: ASTFeatures,
+    compile_args: Sequence[Union[str, bytes]] = ()
+) -> None:
+    """Saves features of the source code to the cache.
+
+    Args:
+        source: Raw source code.
+        extension: Extension responsible for the analyzed programming language.
+        features: Features extracted from the source code.
+        compile_args: Arguments with which the source code is parsed.
+    """
+
+    cache_file = get_cache_file(source, extension, compile_args)
+    tmp_file = cache_file.with_suffix(
+        f'.{os.getpid()}.{threading.get_ident()}.tmp'
+    )
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file.write_bytes(serialize_features(features))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        return
+
+
+def prune_cache(max_size: int = CACHE_MAX_SIZE) -> None:
+    """Removes the entries of the previous formats of the cache and
+    the least recently used entries which exceed the size limit.
+
+    Args:
+        max_size: The maximum total size of the entries in bytes.
+    """
+
+    cache_dir = get_cache_dir()
+    _remove_stale_entries(cache_dir)
+    _remove_least_recently_used(cache_dir, max_size)
+
+
+def _remove_stale_entries(cache_dir: Path) -> None:
+    try:
+        entries = list(AST_CACHE_PATH.iterdir())
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry == cache_dir:
+            continue
+
+        try:
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+        except OSError:
+            continue
+
+
+def _remove_least_recently_used(cache_dir: Path, max_size: int) -> None:
+    try:
+        entries = list(cache_dir.iterdir())
+    except OSError:
+        return
+
+    stats = []
+    for entry in entries:
+        try:
+            stats.append((entry.stat(), entry))
+        except OSError:
+            continue
+
+    total_size = sum(stat.st_size for stat, _ in stats)
+    for stat, entry in sorted(stats, key=lambda item: item[0].st_mtime):
+        if total_size <= max_size:
+            break
+
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+        total_size -= stat.st_size
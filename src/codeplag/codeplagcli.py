@@ -57,6 +57,21 @@ class FilePath(Path):
         return Path.__new__(Path, *args, **kwargs)
 
 
+def positive_int(value: str) -> int:
+    """Converts the CLI argument to int, raising argparse.ArgumentTypeError
+    if it is not a positive number.
+    """
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a positive integer.")
+
+    return number
+
+
 class CodeplagCLI(argparse.ArgumentParser):
     """The argument parser of the codeplag util."""
 
@@ -97,6 +112,13 @@ class CodeplagCLI(argparse.ArgumentParser):
             "modify",
             help=f"Manage the '{UTIL_NAME}' util settings.",
         )
+        settings_modify.add_argument(
+            "-ac",
+            "--ast_cache",
+            help="Cache the features of the parsed source codes on the disk.",
+            type=int,
+            choices=[0, 1],
+        )
         settings_modify.add_argument(
             "-env",
             "--environment",
@@ -173,6 +195,13 @@ class CodeplagCLI(argparse.ArgumentParser):
             "Used with options 'directories', 'github-user' and 'github-project-folders'.",
             type=str,
         )
+        check.add_argument(
+            "-j",
+            "--jobs",
+            help="The number of files which are parsed simultaneously.",
+            type=positive_int,
+            default=1,
+        )
 
         check_required = check.add_argument_group("required options")
         check_required.add_argument(
@@ -3,6 +3,7 @@ import logging
 from pathlib import Path
 from typing import Literal, Optional, TypedDict, Union, overload
 
+import orjson
 from typing_extensions import NotRequired
 
 from codeplag.consts import CONFIG_PATH, DEFAULT_THRESHOLD
@@ -38,8 +39,8 @@ def write_config(file: Path, config: Union[dict, TypedDict]) -> None:
         if isinstance(config_for_dump[key], Path):
             config_for_dump[key] = str(config_for_dump[key])
 
-    with file.open(mode='w', encoding='utf-8') as f:
-        json.dump(config_for_dump, f)
+    with file.open(mode='wb') as f:
+        f.write(orjson.dumps(config_for_dump, option=orjson.OPT_SERIALIZE_NUMPY))
 
 
 def read_settings_conf(logger: logging.Logger) -> Settings:
@@ -73,6 +74,7 @@ def write_settings_conf(settings: Settings) -> None:
 
 
 DefaultSettingsConfig = Settings(
+    ast_cache=1,
     threshold=DEFAULT_THRESHOLD,
     show_progress=0
 )
@@ -2,9 +2,10 @@ import re
 from pathlib import Path
 from typing import Dict, List
 
-from codeplag.types import Extension, Extensions, Mode, Threshold
+from codeplag.types import Extension, Mode, Threshold
 
 # Paths
+AST_CACHE_PATH = Path.home() / ".cache" / "@UTIL_NAME@" / "ast"
 CONFIG_PATH = Path("@CONFIG_PATH@")
 FILE_DOWNLOAD_PATH = Path("/tmp/@UTIL_NAME@_download.out")
 LOG_PATH = Path("@CODEPLAG_LOG_PATH@")
@@ -14,17 +15,16 @@ GET_FRAZE = 'Getting works features from'
 DEFAULT_THRESHOLD: Threshold = 65
 MODE_CHOICE: List[Mode] = ["many_to_many", "one_to_one"]
 EXTENSION_CHOICE: List[Extension] = ["py", "cpp"]
-ALL_EXTENSIONS = (re.compile(r'\..*$'),)
-SUPPORTED_EXTENSIONS: Dict[Extension, Extensions] = {
-    'py': (
-        re.compile(r'\.py$'),
-    ),
-    'cpp': (
-        re.compile(r'\.cpp$'),
-        re.compile(r'\.c$'),
-        re.compile(r'\.h$')
-    ),
+SUPPORTED_EXTENSIONS: Dict[Extension, re.Pattern] = {
+    'py': re.compile(r'\.py$'),
+    'cpp': re.compile(r'\.(cpp|c|h)$'),
 }
 
 UTIL_NAME = "@UTIL_NAME@"
 UTIL_VERSION = "@UTIL_VERSION@"
+
+# The module must be generated from the template by 'make substitute-sources'
+assert all(
+    '@' not in value
+    for value in (UTIL_NAME, UTIL_VERSION, str(CONFIG_PATH), str(LOG_PATH))
+), "The constants module contains not substituted template values."
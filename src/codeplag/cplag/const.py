@@ -12,18 +12,18 @@ def get_compile_args() -> List[str]:
 
 
 COMPILE_ARGS = get_compile_args()
-IGNORE = [
+IGNORE = frozenset({
     CursorKind.PREPROCESSING_DIRECTIVE,
     # CursorKind.MACRO_DEFINITION,
     CursorKind.MACRO_INSTANTIATION,
     CursorKind.INCLUSION_DIRECTIVE,
     CursorKind.USING_DIRECTIVE,
     CursorKind.NAMESPACE
-]
-OPERATORS = (
+})
+OPERATORS = frozenset({
     '+', '-', '*', '/', '%',               # Arithmetic Operators
     '+=', '-=', '*=', '/=', '%=', '=',     # Assignment Operators
     '!', '&&', '||',                       # Logical Operators
     '!=', '==', '<=', '>=', '<', '>',      # Relational Operators
     '^', '&', '|', '<<', '>>', '~'         # Bitwise Operators
-)
+})
@@ -1,16 +1,22 @@
 import logging
-import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Optional
 
-from clang.cindex import Cursor, Index, TranslationUnit
+from clang.cindex import Cursor, Index, TranslationUnit, TranslationUnitLoadError
 
-from codeplag.consts import FILE_DOWNLOAD_PATH, GET_FRAZE, SUPPORTED_EXTENSIONS
+from codeplag.astcache import load_features, read_source, save_features
+from codeplag.consts import FILE_DOWNLOAD_PATH, GET_FRAZE
 from codeplag.cplag.const import COMPILE_ARGS
 from codeplag.cplag.tree import get_features
 from codeplag.getfeatures import AbstractGetter, get_files_path_from_directory
 from codeplag.types import ASTFeatures
 
+# Matches the includes of the local headers such as '#include "utils.h"'
+_LOCAL_INCLUDE_REGEXP = re.compile(rb'^[ \t]*#[ \t]*include[ \t]*"', re.MULTILINE)
+
 
 def get_cursor_from_file(filepath: Path,
                          args: Optional[List[str]] = None) -> Optional[Cursor]:
@@ -35,20 +41,90 @@ def get_cursor_from_file(filepath: Path,
     return file_obj.cursor
 
 
+def get_cursor_from_content(content: str,
+                            filepath: Path,
+                            args: Optional[List[str]] = None) -> Cursor:
+    '''
+        Returns clang.cindex.Cursor object of the source code without
+        writing it to the disk
+        @param content - source code for parsing
+        @param filepath - path under which the source code will be parsed
+        @param args - list of arguments for clang.cindex.Index.parse() method
+    '''
+
+    if args is None:
+        args = []
+
+    index = Index.create()
+    options = TranslationUnit.PARSE_DETAILED_PROCESSING_RECORD
+
+    file_obj: TranslationUnit = index.parse(
+        filepath,
+        args=args,
+        unsaved_files=[(filepath, content)],
+        options=options
+    )
+
+    return file_obj.cursor
+
+
+def has_local_includes(source: bytes) -> bool:
+    '''
+        Returns True if the source code includes local headers. The features
+        of such source code depend on the headers, which are not part of
+        the key of the AST cache, so the source code is not cached.
+        @param source - raw source code
+    '''
+
+    return _LOCAL_INCLUDE_REGEXP.search(source) is not None
+
+
+def get_work_from_filepath(
+    filepath: Path,
+    compile_args: List[str],
+    use_ast_cache: bool = True
+) -> ASTFeatures:
+    source = read_source(filepath) if use_ast_cache else None
+    if source is not None and has_local_includes(source):
+        source = None
+    if source is not None:
+        features = load_features(source, 'cpp', filepath, compile_args)
+        if features is not None:
+            return features
+
+    cursor = get_cursor_from_file(filepath, compile_args)
+    features = get_features(cursor, filepath)
+    if source is not None:
+        save_features(source, 'cpp', features, compile_args)
+
+    return features
+
+
 def get_works_from_filepaths(
     filepaths: List[Path],
-    compile_args: List[str]
+    compile_args: List[str],
+    jobs: int = 1,
+    use_ast_cache: bool = True
 ) -> List[ASTFeatures]:
     if not filepaths:
         return []
 
-    works = []
-    for filepath in filepaths:
-        cursor = get_cursor_from_file(filepath, compile_args)
-        features = get_features(cursor, filepath)
-        works.append(features)
-
-    return works
+    if jobs == 1:
+        return [
+            get_work_from_filepath(filepath, compile_args, use_ast_cache)
+            for filepath in filepaths
+        ]
+
+    # libclang releases the GIL while parsing, and each file gets its own index
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(
+            executor.map(
+                get_work_from_filepath,
+                filepaths,
+                repeat(compile_args),
+                repeat(use_ast_cache)
+            )
+        )
 
 
 class CFeaturesGetter(AbstractGetter):
@@ -59,7 +135,9 @@ class CFeaturesGetter(AbstractGetter):
         all_branches: bool = False,
         logger: Optional[logging.Logger] = None,
         repo_regexp: str = '',
-        path_regexp: str = ''
+        path_regexp: str = '',
+        jobs: int = 1,
+        use_ast_cache: bool = True
     ):
         super().__init__(
             extension='cpp',
@@ -67,14 +145,26 @@ class CFeaturesGetter(AbstractGetter):
             all_branches=all_branches,
             logger=logger,
             repo_regexp=repo_regexp,
-            path_regexp=path_regexp
+            path_regexp=path_regexp,
+            jobs=jobs,
+            use_ast_cache=use_ast_cache
         )
 
     def get_from_content(self, file_content: str, url_to_file: str) -> Optional[ASTFeatures]:
-        with open(FILE_DOWNLOAD_PATH, 'w', encoding='utf-8') as out_file:
-            out_file.write(file_content)
-        cursor = get_cursor_from_file(FILE_DOWNLOAD_PATH, COMPILE_ARGS)
-        if not cursor:
+        source = file_content.encode('utf-8')
+        use_ast_cache = self.use_ast_cache and not has_local_includes(source)
+        if use_ast_cache:
+            features = load_features(
+                source, self.extension, url_to_file, COMPILE_ARGS
+            )
+            if features is not None:
+                return features
+
+        try:
+            cursor = get_cursor_from_content(
+                file_content, FILE_DOWNLOAD_PATH, COMPILE_ARGS
+            )
+        except TranslationUnitLoadError:
             self.logger.warning(
                 "Unsuccessfully attempt to get AST from the file %s.", url_to_file
             )
@@ -82,7 +172,8 @@ class CFeaturesGetter(AbstractGetter):
 
         # hook for correct filtering info while parsing source code
         features = get_features(cursor, FILE_DOWNLOAD_PATH)
-        os.remove(FILE_DOWNLOAD_PATH)
+        if use_ast_cache:
+            save_features(source, self.extension, features, COMPILE_ARGS)
         features.filepath = url_to_file
 
         return features
@@ -92,13 +183,13 @@ class CFeaturesGetter(AbstractGetter):
             return []
 
         self.logger.info(f'{GET_FRAZE} files')
-        return get_works_from_filepaths(files, COMPILE_ARGS)
+        return get_works_from_filepaths(files, COMPILE_ARGS, self.jobs, self.use_ast_cache)
 
     def get_works_from_dir(self, directory: Path) -> List[ASTFeatures]:
         filepaths = get_files_path_from_directory(
             directory,
-            extensions=SUPPORTED_EXTENSIONS[self.extension],
+            extension=self.extension,
             path_regexp=self.path_regexp
         )
 
-        return get_works_from_filepaths(filepaths, COMPILE_ARGS)
+        return get_works_from_filepaths(filepaths, COMPILE_ARGS, self.jobs, self.use_ast_cache)
@@ -2,47 +2,66 @@ import logging
 import os
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Literal, Optional, Union, overload
 
 from decouple import Config, RepositoryEnv
 
 from codeplag.consts import (
-    ALL_EXTENSIONS,
     GET_FRAZE,
     LOG_PATH,
     SUPPORTED_EXTENSIONS,
     UTIL_NAME,
 )
 from codeplag.logger import get_logger
-from codeplag.types import ASTFeatures, Extension, Extensions
+from codeplag.types import ASTFeatures, Extension
 from webparsers.github_parser import GitHubParser
 
 
+@lru_cache(maxsize=8192)
+def classify_extension(filename: str) -> Optional[Extension]:
+    """Returns the supported extension which the file name corresponds to.
+
+    Args:
+        filename: Name of the file.
+
+    Returns:
+        The extension from SUPPORTED_EXTENSIONS or None if
+        the file name doesn't match any of them.
+    """
+
+    for extension, pattern in SUPPORTED_EXTENSIONS.items():
+        if pattern.search(filename) is not None:
+            return extension
+
+    return None
+
+
 def get_files_path_from_directory(
     directory: Path,
-    extensions: Optional[Extensions] = None,
+    extension: Optional[Extension] = None,
     path_regexp: Optional[re.Pattern] = None
 ) -> List[Path]:
     """Recursive gets file paths from provided directory.
 
     Args:
         directory: Root directory for getting paths.
-        extensions: Available extensions for filtering.
+        extension: Supported extension for filtering.
+          If not provided, then accepts all files with any extension.
         path_regexp: Provided regular expression for filtering file paths.
 
     Returns:
         Paths to all files in the directory and its subdirectories.
     """
 
-    if extensions is None:
-        extensions = ALL_EXTENSIONS
-
     allowed_files = []
     for current_dir, _, filenames in os.walk(directory):
         for filename in filenames:
-            allowed = any(ext.search(filename) for ext in extensions)
-            if not allowed:
+            if extension is None:
+                if '.' not in filename:
+                    continue
+            elif classify_extension(filename) != extension:
                 continue
 
             path_to_file = Path(current_dir, filename)
@@ -65,10 +84,14 @@ class AbstractGetter(ABC):
         all_branches: bool = False,
         logger: Optional[logging.Logger] = None,
         repo_regexp: Optional[str] = None,
-        path_regexp: Optional[str] = None
+        path_regexp: Optional[str] = None,
+        jobs: int = 1,
+        use_ast_cache: bool = True
     ):
         self.logger = logger if logger is not None else logging.getLogger(UTIL_NAME)
         self.extension: Extension = extension
+        self.jobs = jobs
+        self.use_ast_cache = use_ast_cache
         self.repo_regexp = re.compile(repo_regexp) if repo_regexp is not None else repo_regexp
         self.path_regexp = re.compile(path_regexp) if path_regexp is not None else path_regexp
         self._set_access_token(environment)
@@ -91,7 +114,7 @@ class AbstractGetter(ABC):
 
     def _set_github_parser(self, branch_policy: bool) -> None:
         self.github_parser = GitHubParser(
-            file_extensions=SUPPORTED_EXTENSIONS[self.extension],
+            file_extensions=(SUPPORTED_EXTENSIONS[self.extension],),
             check_all=branch_policy,
             access_token=self._access_token,
             logger=get_logger('webparsers', LOG_PATH)
@@ -147,8 +170,8 @@ class AbstractGetter(ABC):
             return works
 
         self.logger.info(f"{GET_FRAZE} GitHub urls")
-        for github_file in github_files:
-            file_content = self.github_parser.get_file_from_url(github_file)[0]
+        gh_files = self.github_parser.get_files_from_urls(github_files)
+        for github_file, (file_content, _) in zip(github_files, gh_files):
             features = self.get_from_content(file_content, github_file)
             if features:
                 works.append(features)
@@ -27,6 +27,24 @@ class StreamFormatter(logging.Formatter):
         return super().format(record)
 
 
+class StdoutHandler(logging.Handler):
+    """Handler which always writes to the current sys.stdout, even if it was
+    replaced after creating the handler.
+    """
+
+    terminator = '\n'
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record)
+            sys.stdout.write(msg + self.terminator)
+            sys.stdout.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 def get_file_handler(filename: Path) -> logging.FileHandler:
     log_format = (
         '%(asctime)s - [%(levelname)s] - %(name)s - '
@@ -43,8 +61,8 @@ def get_file_handler(filename: Path) -> logging.FileHandler:
     return file_handler
 
 
-def get_stream_handler() -> logging.StreamHandler:
-    stream_handler = logging.StreamHandler(stream=sys.stdout)
+def get_stream_handler() -> logging.Handler:
+    stream_handler = StdoutHandler()
     stream_handler.setLevel(logging.INFO)
     stream_handler.setFormatter(StreamFormatter())
 
@@ -53,6 +71,9 @@ def get_stream_handler() -> logging.StreamHandler:
 
 def get_logger(name: str, filename: Path) -> logging.Logger:
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
     logger.setLevel(logging.DEBUG)
     logger.addHandler(get_file_handler(filename))
     logger.addHandler(get_stream_handler())
@@ -1,9 +1,12 @@
 import ast
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Optional, Union
 
-from codeplag.consts import GET_FRAZE, LOG_PATH, SUPPORTED_EXTENSIONS
+from codeplag.astcache import load_features, read_source, save_features
+from codeplag.consts import GET_FRAZE, LOG_PATH
 from codeplag.display import red_bold
 from codeplag.getfeatures import AbstractGetter, get_files_path_from_directory
 from codeplag.logger import get_logger
@@ -83,20 +86,53 @@ def get_features_from_ast(tree: ast.Module, filepath: Union[Path, str]) -> ASTFe
     return features
 
 
-def get_works_from_filepaths(filenames: List[Path]) -> List[ASTFeatures]:
-    if not filenames:
-        return []
+def get_work_from_filepath(
+    filename: Path,
+    use_ast_cache: bool = True
+) -> Optional[ASTFeatures]:
+    source = read_source(filename) if use_ast_cache else None
+    if source is not None:
+        features = load_features(source, 'py', filename)
+        if features is not None:
+            return features
+
+    tree = get_ast_from_filename(filename)
+    if not tree:
+        return None
+
+    features = get_features_from_ast(tree, filename)
+    if source is not None:
+        save_features(source, 'py', features)
 
-    works = []
-    for filename in filenames:
-        tree = get_ast_from_filename(filename)
-        if not tree:
-            continue
+    return features
 
-        features = get_features_from_ast(tree, filename)
-        works.append(features)
 
-    return works
+def get_works_from_filepaths(
+    filenames: List[Path],
+    jobs: int = 1,
+    use_ast_cache: bool = True
+) -> List[ASTFeatures]:
+    if not filenames:
+        return []
+
+    if jobs == 1:
+        works = map(get_work_from_filepath, filenames, repeat(use_ast_cache))
+    else:
+        # Parsing and walking of the trees hold the GIL, so the files are
+        # parsed in the separate processes. Keeps the order of the works
+        # the same as the order of the files
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            works = list(
+                executor.map(
+                    get_work_from_filepath,
+                    filenames,
+                    repeat(use_ast_cache),
+                    # Sends the files to the workers by several at once
+                    chunksize=max(1, len(filenames) // (4 * jobs))
+                )
+            )
+
+    return [work for work in works if work is not None]
 
 
 class PyFeaturesGetter(AbstractGetter):
@@ -107,7 +143,9 @@ class PyFeaturesGetter(AbstractGetter):
         all_branches: bool = False,
         logger: Optional[logging.Logger] = None,
         repo_regexp: str = '',
-        path_regexp: str = ''
+        path_regexp: str = '',
+        jobs: int = 1,
+        use_ast_cache: bool = True
     ):
         super().__init__(
             extension='py',
@@ -115,13 +153,24 @@ class PyFeaturesGetter(AbstractGetter):
             all_branches=all_branches,
             logger=logger,
             repo_regexp=repo_regexp,
-            path_regexp=path_regexp
+            path_regexp=path_regexp,
+            jobs=jobs,
+            use_ast_cache=use_ast_cache
         )
 
     def get_from_content(self, file_content: str, url_to_file: str) -> Optional[ASTFeatures]:
+        source = file_content.encode('utf-8')
+        if self.use_ast_cache:
+            features = load_features(source, self.extension, url_to_file)
+            if features is not None:
+                return features
+
         tree = get_ast_from_content(file_content, url_to_file)
         if tree is not None:
-            return get_features_from_ast(tree, url_to_file)
+            features = get_features_from_ast(tree, url_to_file)
+            if self.use_ast_cache:
+                save_features(source, self.extension, features)
+            return features
 
         self.logger.warning(
             "Unsuccessfully attempt to get AST from the file %s.", url_to_file
@@ -133,13 +182,13 @@ class PyFeaturesGetter(AbstractGetter):
             return []
 
         self.logger.info(f'{GET_FRAZE} files')
-        return get_works_from_filepaths(files)
+        return get_works_from_filepaths(files, self.jobs, self.use_ast_cache)
 
     def get_works_from_dir(self, directory: Path) -> List[ASTFeatures]:
         filepaths = get_files_path_from_directory(
             directory,
-            extensions=SUPPORTED_EXTENSIONS[self.extension],
+            extension=self.extension,
             path_regexp=self.path_regexp
         )
 
-        return get_works_from_filepaths(filepaths)
+        return get_works_from_filepaths(filepaths, self.jobs, self.use_ast_cache)
@@ -7,8 +7,6 @@ from typing import (
     Literal,
     NamedTuple,
     Optional,
-    Pattern,
-    Tuple,
     TypedDict,
     Union,
 )
@@ -18,7 +16,6 @@ import numpy.typing as npt
 from typing_extensions import NotRequired
 
 Extension = Literal["py", "cpp"]
-Extensions = Tuple[Pattern, ...]
 Flag = Literal[0, 1]
 Mode = Literal["many_to_many", "one_to_one"]
 Threshold = Literal[
@@ -51,9 +48,9 @@ class ASTFeatures:
 
     count_of_nodes: int = 0
     head_nodes: List[str] = field(default_factory=list)
-    operators: Dict[str, int] = field(default_factory=lambda: defaultdict(lambda: 0))
-    keywords: Dict[str, int] = field(default_factory=lambda: defaultdict(lambda: 0))
-    literals: Dict[str, int] = field(default_factory=lambda: defaultdict(lambda: 0))
+    operators: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    keywords: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    literals: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
     # unique nodes
     unodes: Dict[str, int] = field(default_factory=dict)
@@ -99,6 +96,7 @@ class WorksReport(TypedDict):
 
 
 class Settings(TypedDict):
+    ast_cache: Flag
     environment: NotRequired[Path]
     reports: NotRequired[Path]
     show_progress: Flag
@@ -12,11 +12,10 @@ import pandas as pd
 
 from codeplag.algorithms.featurebased import counter_metric, struct_compare
 from codeplag.algorithms.tokenbased import value_jakkar_coef
+from codeplag.astcache import prune_cache
 from codeplag.config import read_settings_conf, write_config, write_settings_conf
-from codeplag.cplag.utils import CFeaturesGetter
 from codeplag.display import print_compare_result
 from codeplag.getfeatures import AbstractGetter
-from codeplag.pyplag.utils import PyFeaturesGetter
 from codeplag.types import (
     ASTFeatures,
     CompareInfo,
@@ -139,6 +138,7 @@ class CodeplagEngine:
                 return
 
             # Check if all None, print error
+            self.ast_cache: Flag = parsed_args.pop("ast_cache")
             self.environment: Optional[Path] = parsed_args.pop("environment")
             self.reports: Optional[Path] = parsed_args.pop("reports")
             self.threshold: int = parsed_args.pop("threshold")
@@ -148,6 +148,7 @@ class CodeplagEngine:
             self._set_features_getter(parsed_args, settings_conf, logger)
 
             self.mode: str = parsed_args.pop('mode', 'many_to_many')
+            self.ast_cache: Flag = settings_conf['ast_cache']
             self.show_progress: Flag = settings_conf.get('show_progress')
             self.threshold: int = settings_conf["threshold"]
             self.reports: Optional[Path] = settings_conf.pop(
@@ -170,17 +171,21 @@ class CodeplagEngine:
         logger: logging.Logger
     ) -> None:
         extension: Extension = parsed_args.pop('extension')
+        # Imported here since loading of the C++ getter loads libclang and
+        # runs the compiler for getting its include paths
         if extension == 'py':
-            FeaturesGetter = PyFeaturesGetter
+            from codeplag.pyplag.utils import PyFeaturesGetter as FeaturesGetter
         elif extension == 'cpp':
-            FeaturesGetter = CFeaturesGetter
+            from codeplag.cplag.utils import CFeaturesGetter as FeaturesGetter
 
         self.features_getter: AbstractGetter = FeaturesGetter(
             environment=settings_conf.get("environment"),
             all_branches=parsed_args.pop('all_branches', False),
             logger=logger,
             repo_regexp=parsed_args.pop('repo_regexp', None),
-            path_regexp=parsed_args.pop('path_regexp', None)
+            path_regexp=parsed_args.pop('path_regexp', None),
+            jobs=parsed_args.pop('jobs', 1),
+            use_ast_cache=bool(settings_conf['ast_cache'])
         )
 
     def save_result(self,
@@ -194,10 +199,6 @@ class CodeplagEngine:
             )
             return
 
-        struct_info_dict = structure._asdict()
-        struct_info_dict['compliance_matrix'] = (
-            struct_info_dict['compliance_matrix'].tolist()
-        )
         report = WorksReport(
             date=datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
             first_path=first_work.filepath.__str__(),
@@ -205,7 +206,7 @@ class CodeplagEngine:
             first_heads=first_work.head_nodes,
             second_heads=second_work.head_nodes,
             fast=fast_metrics._asdict(),
-            structure=struct_info_dict
+            structure=structure._asdict()
         )
 
         try:
@@ -361,6 +362,8 @@ class CodeplagEngine:
                 if self.show_progress:
                     iteration += 1  # type: ignore
 
+        if self.ast_cache:
+            prune_cache()
         self.features_getter.logger.debug(f'Time for all {perf_counter() - begin_time:.2f} s')
         self.features_getter.logger.info("Ending searching for plagiarism.")
 
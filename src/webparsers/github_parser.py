@@ -1,10 +1,33 @@
-import base64
+import codecs
+import functools
+import json
 import logging
+import os
 import re
 import sys
-from typing import Any, Dict, Iterator, List, Optional
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qs, urlsplit
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from webparsers.types import (
     Branch,
@@ -16,6 +39,91 @@ from webparsers.types import (
     WorkInfo,
 )
 
+# The maximum size of the page of the paginated lists allowed by GitHub
+_PAGE_SIZE = 100
+# The number of pages of the paginated lists which are requested concurrently
+_PAGES_WORKERS = 4
+# The number of the file blobs which are requested concurrently and
+# the limit of the requested blobs which are not yielded yet
+_BLOBS_WORKERS = 8
+_BLOBS_WINDOW = 2 * _BLOBS_WORKERS
+# The number of the last requested blobs whose contents are reused for
+# the files with the same sha
+_BLOBS_CACHE_SIZE = 1024
+_CHUNK_SIZE = 65536
+# The number of the files which are requested by one GraphQL query, since
+# GitHub limits the size and the complexity of the queries
+_GRAPHQL_BATCH_SIZE = 100
+# Seconds during which the cached payload is returned without a request
+_CACHE_TTL = 60.0
+_CACHE_SIZE = 128
+# Transient errors of the API are retried with the exponential backoff
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[502, 503, 504],
+    allowed_methods={'GET'},
+    respect_retry_after_header=True
+)
+# Matches the regular expressions of the form '\.py$' or '\.(cpp|c|h)$'
+_SUFFIXES_REGEXP = re.compile(r'\\\.(?:(\w+)|\((\w+(?:\|\w+)*)\))\$')
+
+
+class _CachedPayload(NamedTuple):
+    timestamp: float
+    etag: str
+    payload: Any
+
+
+def get_extension_suffixes(
+    extension: Union[str, Pattern]
+) -> Optional[Tuple[str, ...]]:
+    '''
+        Function returns file suffixes which are equivalent to the extension
+        or None if the extension is a regular expression of another form
+        @param extension - extension without the dot such as 'py' or
+        the regular expression for the file paths
+    '''
+    if isinstance(extension, str):
+        return (f'.{extension}',)
+
+    if extension.flags & ~re.UNICODE:
+        return None
+
+    match = _SUFFIXES_REGEXP.fullmatch(extension.pattern)
+    if match is None:
+        return None
+
+    suffixes = match.group(1) or match.group(2)
+    return tuple(f'.{suffix}' for suffix in suffixes.split('|'))
+
+
+def _load_json(response: requests.Response) -> Any:
+    # orjson parses the big lists and trees faster than the json module
+    return orjson.loads(response.content)
+
+
+def _get_last_page(response: requests.Response) -> int:
+    # GitHub omits the Link header when the whole list fits on one page
+    last = response.links.get('last')
+    if last is None:
+        return 1
+
+    return int(parse_qs(urlsplit(last['url']).query)['page'][0])
+
+
+def _get_blob_result(future: Future, link: Optional[str]) -> WorkInfo:
+    work_info: WorkInfo = future.result()
+    if link is None:
+        return work_info
+
+    return work_info._replace(link=link)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
 
 class GitHubParser:
     def __init__(
@@ -31,22 +139,57 @@ class GitHubParser:
             self.logger = logger
 
         self.__file_extensions = file_extensions
+        # Most extensions are checked by the suffix without the regexp engine
+        self.__suffixes: FrozenSet[str] = frozenset()
+        self.__extension_regexps: Tuple[Pattern, ...] = ()
+        for extension in file_extensions or ():
+            suffixes = get_extension_suffixes(extension)
+            if suffixes is None:
+                self.__extension_regexps += (extension,)
+            else:
+                self.__suffixes |= frozenset(suffixes)
         self.__access_token = access_token
         self.__check_all_branches = check_all
 
+        # Keeps the connections to the API alive between the requests
+        self._session = requests.Session()
+        self._session.mount(
+            'https://',
+            HTTPAdapter(
+                pool_connections=10, pool_maxsize=20, max_retries=_RETRY
+            )
+        )
+        self._session.headers.update(self.__get_headers())
+
+        # Payloads of the small GET responses by the url and the params
+        self._cache: OrderedDict[
+            Tuple[str, FrozenSet[Tuple[str, Any]]], _CachedPayload
+        ] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def __enter__(self) -> 'GitHubParser':
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._session.close()
+
     def is_accepted_extension(self, path: str) -> bool:
         if self.__file_extensions is None:
             return True
 
-        return any(
-            re.search(extension, path) for extension in self.__file_extensions
+        return os.path.splitext(path)[1] in self.__suffixes or any(
+            regexp.search(path) for regexp in self.__extension_regexps
         )
 
     def send_get_request(
         self,
         api_url: str,
         params: Optional[dict] = None,
-        address: str = 'https://api.github.com'
+        address: str = 'https://api.github.com',
+        headers: Optional[Dict[str, str]] = None
     ) -> requests.Response:
         if params is None:
             params = {}
@@ -54,19 +197,81 @@ class GitHubParser:
         if address and len(api_url) and api_url[0] != "/":
             address += "/"
 
-        headers = {
-            # Recommended
-            'accept': 'application/vnd.github.v3+json'
-        }
         url = address + api_url
-        if self.__access_token != '':
-            headers.update({
-                'Authorization': 'token ' + self.__access_token,
-            })
 
+        request_kwargs: Dict[str, Any] = {'params': params}
+        if headers:
+            request_kwargs['headers'] = headers
+
+        response = self.__get(url, **request_kwargs)
+        # The response 304 is returned only to the conditional requests
+        if response.status_code != 304:
+            self.__check_response(response, url)
+
+        return response
+
+    def get_json(self, api_url: str, params: Optional[dict] = None) -> Any:
+        '''
+            Function returns the JSON of the response to the GET request.
+            The payloads are cached for _CACHE_TTL seconds and revalidated
+            by ETag after that, so the function is used only for the small
+            responses such as repositories and branches
+        '''
+        cache_key = (api_url, frozenset((params or {}).items()))
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached.timestamp < _CACHE_TTL:
+            return cached.payload
+
+        request_kwargs: Dict[str, Any] = {}
+        if params is not None:
+            request_kwargs['params'] = params
+        if cached is not None and cached.etag:
+            # The response 304 isn't counted against the rate limit
+            request_kwargs['headers'] = {'If-None-Match': cached.etag}
+
+        response = self.send_get_request(api_url, **request_kwargs)
+        if cached is not None and response.status_code == 304:
+            payload = cached.payload
+            etag = response.headers.get('ETag') or cached.etag
+        else:
+            payload = _load_json(response)
+            etag = response.headers.get('ETag', '')
+
+        self.__cache_payload(
+            cache_key, _CachedPayload(time.monotonic(), etag, payload)
+        )
+
+        return payload
+
+    def __get(self, url: str, **kwargs: Any) -> requests.Response:
         # Check Ethernet connection and requests limit
         try:
-            response = requests.get(url, headers=headers, params=params)
+            return self._session.get(url, **kwargs)
+        except requests.exceptions.ConnectionError as err:
+            self.logger.error(
+                "Connection error. Please check the Internet connection."
+            )
+            self.logger.debug(str(err))
+            sys.exit(1)
+        except requests.exceptions.RetryError as err:
+            self.logger.error(
+                "GitHub is unavailable now. Please try again later."
+            )
+            self.logger.debug(str(err))
+            sys.exit(1)
+
+    def send_graphql_request(
+        self,
+        query: str,
+        url: str = 'https://api.github.com/graphql'
+    ) -> Dict[str, Any]:
+        '''
+            Function returns the JSON of the response to the GraphQL query,
+            the GitHub GraphQL API is available only with the access token
+        '''
+        try:
+            response = self._session.post(url, json={'query': query})
         except requests.exceptions.ConnectionError as err:
             self.logger.error(
                 "Connection error. Please check the Internet connection."
@@ -74,9 +279,37 @@ class GitHubParser:
             self.logger.debug(str(err))
             sys.exit(1)
 
+        self.__check_response(response, url)
+
+        return _load_json(response)
+
+    def __get_headers(self) -> Dict[str, str]:
+        headers = {
+            # Recommended
+            'accept': 'application/vnd.github.v3+json'
+        }
+        if self.__access_token != '':
+            headers.update({
+                'Authorization': 'token ' + self.__access_token,
+            })
+
+        return headers
+
+    def __cache_payload(
+        self,
+        key: Tuple[str, FrozenSet[Tuple[str, Any]]],
+        cached: _CachedPayload
+    ) -> None:
+        with self._cache_lock:
+            self._cache[key] = cached
+            self._cache.move_to_end(key)
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def __check_response(self, response: requests.Response, url: str) -> None:
         if response.status_code in [400, 403, 404]:
             self.logger.error(
-                f"GitHub error: '{response.json()['message']}' for url '{url}'."
+                f"GitHub error: '{_load_json(response)['message']}' for url '{url}'."
             )
             sys.exit(1)
 
@@ -87,94 +320,84 @@ class GitHubParser:
             self.logger.debug(str(err))
             sys.exit(1)
 
-        return response
+    def __get_pages(
+        self,
+        api_url: str,
+        executor: ThreadPoolExecutor
+    ) -> Iterator[List[Dict[str, Any]]]:
+        '''
+            Function yields pages of the paginated list in order. The first
+            page is requested alone and the rest of the pages up to the last
+            one from its Link header are requested concurrently.
+        '''
+        response = self.__get_page(api_url, 1)
+        response_json = _load_json(response)
+        if len(response_json) == 0:
+            return
+
+        yield response_json
+
+        for response in executor.map(
+            functools.partial(self.__get_page, api_url),
+            range(2, _get_last_page(response) + 1)
+        ):
+            yield _load_json(response)
+
+    def __get_page(self, api_url: str, page: int) -> requests.Response:
+        return self.send_get_request(
+            api_url,
+            params={
+                'per_page': _PAGE_SIZE,
+                'page': page
+            }
+        )
 
     def get_list_of_repos(
         self,
         owner: str,
-        reg_exp: Optional[re.Pattern] = None
-    ) -> List[Repository]:
+        reg_exp: Optional[Union[str, Pattern]] = None
+    ) -> Iterator[Repository]:
         '''
-            Function returns dict in which keys characterize repository names
-            and values characterize repositories links
+            Function yields repositories of the owner while the next pages
+            of the list are requested in the background
         '''
-        repos: List[Repository] = []
-        page: int = 1
+        if isinstance(reg_exp, str):
+            reg_exp = _compile(reg_exp)
         api_url: str = f'/users/{owner}/repos'
-        while True:
-            params: Dict[str, int] = {
-                'per_page': 100,
-                'page': page
-            }
-            response_json = self.send_get_request(
-                api_url,
-                params=params
-            ).json()
-
-            if len(response_json) == 0:
-                break
-
-            for repo in response_json:
-                if (
-                    (reg_exp is None) or
-                    re.search(reg_exp, repo['name']) is not None
-                ):
-                    repos.append(
-                        Repository(
+        with ThreadPoolExecutor(max_workers=_PAGES_WORKERS) as executor:
+            for response_json in self.__get_pages(api_url, executor):
+                for repo in response_json:
+                    if (
+                        (reg_exp is None) or
+                        reg_exp.search(repo['name']) is not None
+                    ):
+                        yield Repository(
                             name=repo['name'],
                             html_url=repo['html_url']
                         )
-                    )
-
-            page += 1
-
-        return repos
 
     def get_pulls_info(
         self,
         owner: str,
         repo: str
-    ) -> List[PullRequest]:
-        pulls: List[PullRequest] = []
-        page: int = 1
+    ) -> Iterator[PullRequest]:
         api_url: str = f'/repos/{owner}/{repo}/pulls'
-        while True:
-            params: Dict[str, int] = {
-                'per_page': 100,
-                'page': page
-            }
-            response_json = self.send_get_request(
-                api_url,
-                params=params
-            ).json()
-
-            if len(response_json) == 0:
-                break
-
-            for pull in response_json:
-                commits = self.send_get_request(
-                    pull['commits_url'],
-                    address=''
-                ).json()
-                pull_owner, owner_branch = pull['head']['label'].split(':')
-                pulls.append(
-                    PullRequest(
+        with ThreadPoolExecutor(max_workers=_PAGES_WORKERS) as executor:
+            for response_json in self.__get_pages(api_url, executor):
+                for pull in response_json:
+                    pull_owner, owner_branch = pull['head']['label'].split(':')
+                    yield PullRequest(
                         number=pull['number'],
-                        last_commit_sha=commits[0]['sha'],
+                        last_commit_sha=pull['head']['sha'],
                         owner=pull_owner,
                         branch=owner_branch,
                         state=pull['state'],
                         draft=pull['draft']
                     )
-                )
-
-            page += 1
-
-        return pulls
 
     def get_name_default_branch(self, owner: str, repo: str) -> str:
         api_url: str = f'/repos/{owner}/{repo}'
-        response: Dict[str, Any] = self.send_get_request(api_url).json()
+        response: Dict[str, Any] = self.get_json(api_url)
 
         return response['default_branch']
 
@@ -185,7 +408,7 @@ class GitHubParser:
         branch: str = 'main'
     ) -> str:
         api_url: str = f'/repos/{owner}/{repo}/branches/{branch}'
-        response: Dict[str, Any] = self.send_get_request(api_url).json()
+        response: Dict[str, Any] = self.get_json(api_url)
 
         return response['commit']['sha']
 
@@ -196,13 +419,22 @@ class GitHubParser:
         sha: str,
         file_path: str
     ) -> WorkInfo:
-        api_url: str = f'/repos/{owner}/{repo}/git/blobs/{sha}'
-        response: Dict[str, Any] = self.send_get_request(api_url).json()
-
-        file_in_bytes: bytearray = bytearray(
-            base64.b64decode(response['content'])
+        '''
+            Function returns the content of the blob, which is streamed in
+            the raw form without the base64 encoding. The blobs are
+            identified by the sha, so they are not cached.
+        '''
+        url = f'https://api.github.com/repos/{owner}/{repo}/git/blobs/{sha}'
+        response = self.__get(
+            url, headers={'accept': 'application/vnd.github.v3.raw'}, stream=True
         )
-        code = file_in_bytes.decode('utf-8', errors='ignore')
+        self.__check_response(response, url)
+
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        code = ''.join(
+            decoder.decode(chunk)
+            for chunk in response.iter_content(chunk_size=_CHUNK_SIZE)
+        ) + decoder.decode(b'', final=True)
 
         return WorkInfo(code, file_path)
 
@@ -213,11 +445,105 @@ class GitHubParser:
         branch: str,
         sha: str,
         path: str = '',
-        path_regexp: Optional[re.Pattern] = None
+        path_regexp: Optional[Union[str, Pattern]] = None
     ) -> Iterator[WorkInfo]:
+        '''
+            Function yields files of the tree with all its subtrees, which
+            are listed by one request
+        '''
+        if isinstance(path_regexp, str):
+            path_regexp = _compile(path_regexp)
         api_url = f'/repos/{owner}/{repo}/git/trees/{sha}'
-        jresponse: Dict[str, Any] = self.send_get_request(api_url).json()
-        tree: list[Dict[str, Any]] = jresponse['tree']
+        jresponse: Dict[str, Any] = _load_json(
+            self.send_get_request(api_url, params={'recursive': 1})
+        )
+        if jresponse.get('truncated'):
+            # The tree is too big for one response, so walk it by subtrees
+            blobs = self.__get_blobs_from_tree(
+                owner, repo, branch, sha, path, path_regexp
+            )
+        else:
+            blobs = self.__get_blobs_from_flat_tree(
+                owner, repo, branch, jresponse['tree'], path, path_regexp
+            )
+
+        yield from self.__get_files_from_blobs(owner, repo, blobs)
+
+    def __get_files_from_blobs(
+        self,
+        owner: str,
+        repo: str,
+        blobs: Iterator[Tuple[str, str]]
+    ) -> Iterator[WorkInfo]:
+        '''
+            Function yields contents of the blobs in the order of the blobs,
+            the next _BLOBS_WINDOW blobs are requested concurrently and
+            the blobs with the same sha (copied files) are requested once
+            @param blobs - pairs of the sha of the blob and the link to the file
+        '''
+        with ThreadPoolExecutor(max_workers=_BLOBS_WORKERS) as executor:
+            # The link is set only for the copies of the requested blobs
+            futures: Deque[Tuple[Future, Optional[str]]] = deque()
+            requested: OrderedDict[str, Future] = OrderedDict()
+            for blob_sha, link in blobs:
+                if len(futures) == _BLOBS_WINDOW:
+                    yield _get_blob_result(*futures.popleft())
+
+                future = requested.get(blob_sha)
+                if future is not None:
+                    requested.move_to_end(blob_sha)
+                    futures.append((future, link))
+                    continue
+
+                future = executor.submit(
+                    self.get_file_content_from_sha,
+                    owner,
+                    repo,
+                    blob_sha,
+                    link
+                )
+                requested[blob_sha] = future
+                if len(requested) > _BLOBS_CACHE_SIZE:
+                    requested.popitem(last=False)
+                futures.append((future, None))
+
+            while futures:
+                yield _get_blob_result(*futures.popleft())
+
+    def __get_blobs_from_flat_tree(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        tree: List[Dict[str, Any]],
+        path: str,
+        path_regexp: Optional[re.Pattern]
+    ) -> Iterator[Tuple[str, str]]:
+        for node in tree:
+            if node["type"] != "blob":
+                continue
+
+            current_path = f"{path}/{node['path']}"
+            full_link = (
+                f"https://github.com/{owner}/{repo}/blob/{branch}{current_path}"
+            )
+            if not self.__is_accepted_file(current_path, full_link, path_regexp):
+                continue
+
+            yield node["sha"], full_link
+
+    def __get_blobs_from_tree(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        sha: str,
+        path: str,
+        path_regexp: Optional[re.Pattern]
+    ) -> Iterator[Tuple[str, str]]:
+        api_url = f'/repos/{owner}/{repo}/git/trees/{sha}'
+        jresponse: Dict[str, Any] = _load_json(self.send_get_request(api_url))
+        tree: List[Dict[str, Any]] = jresponse['tree']
         for node in tree:
             current_path = f"{path}/{node['path']}"
             full_link = (
@@ -225,28 +551,27 @@ class GitHubParser:
             )
             node_type = node["type"]
             if node_type == "tree":
-                yield from self.get_files_generator_from_sha_commit(
-                    owner=owner,
-                    repo=repo,
-                    branch=branch,
-                    sha=node['sha'],
-                    path=current_path,
-                    path_regexp=path_regexp
+                yield from self.__get_blobs_from_tree(
+                    owner, repo, branch, node['sha'], current_path, path_regexp
                 )
                 continue
             elif (
                 node_type != "blob"
-                or not self.is_accepted_extension(current_path)
-                or (path_regexp is not None and path_regexp.search(full_link) is None)
+                or not self.__is_accepted_file(current_path, full_link, path_regexp)
             ):
                 continue
 
-            yield self.get_file_content_from_sha(
-                owner,
-                repo,
-                node["sha"],
-                full_link
-            )
+            yield node["sha"], full_link
+
+    def __is_accepted_file(
+        self,
+        path: str,
+        link: str,
+        path_regexp: Optional[re.Pattern]
+    ) -> bool:
+        return self.is_accepted_extension(path) and (
+            path_regexp is None or path_regexp.search(link) is not None
+        )
 
     def get_list_repo_branches(
         self,
@@ -254,37 +579,23 @@ class GitHubParser:
         repo: str
     ) -> List[Branch]:
         branches: List[Branch] = []
-        page: int = 1
         api_url: str = f'/repos/{owner}/{repo}/branches'
-        while True:
-            params: Dict[str, int] = {
-                "per_page": 100,
-                "page": page
-            }
-            response_json = self.send_get_request(
-                api_url,
-                params=params
-            ).json()
-
-            if len(response_json) == 0:
-                break
-
-            for node in response_json:
-                branches.append(
-                    Branch(
-                        name=node["name"],
-                        last_commit_sha=node['commit']['sha']
+        with ThreadPoolExecutor(max_workers=_PAGES_WORKERS) as executor:
+            for response_json in self.__get_pages(api_url, executor):
+                for node in response_json:
+                    branches.append(
+                        Branch(
+                            name=node["name"],
+                            last_commit_sha=node['commit']['sha']
+                        )
                     )
-                )
-
-            page += 1
 
         return branches
 
     def get_files_generator_from_repo_url(
         self,
         repo_url: str,
-        path_regexp: Optional[re.Pattern] = None
+        path_regexp: Optional[Union[str, Pattern]] = None
     ) -> Iterator[WorkInfo]:
         try:
             repo_url = GitHubRepoUrl(repo_url)
@@ -337,7 +648,7 @@ class GitHubParser:
         params = {
             'ref': file_url.branch
         }
-        response_json = self.send_get_request(api_url, params=params).json()
+        response_json = _load_json(self.send_get_request(api_url, params=params))
 
         return self.get_file_content_from_sha(
             file_url.owner,
@@ -346,11 +657,118 @@ class GitHubParser:
             file_url
         )
 
+    def get_files_from_urls(self, file_urls: List[str]) -> List[WorkInfo]:
+        '''
+            Function returns contents of the files in the same order as
+            the provided urls. With the access token the files are fetched
+            by GraphQL requests of _GRAPHQL_BATCH_SIZE files, otherwise by
+            REST requests per file. Files which are not resolved by
+            the GraphQL requests are requested through REST API and
+            the blobs which are truncated or binary in GraphQL are
+            requested in the raw form.
+        '''
+        if self.__access_token == '':
+            return [self.get_file_from_url(file_url) for file_url in file_urls]
+
+        content_urls: List[GitHubContentUrl] = []
+        for file_url in file_urls:
+            try:
+                content_urls.append(GitHubContentUrl(file_url))
+            except ValueError as error:
+                self.logger.error(
+                    f'{file_url} is incorrect link to content of GitHub repository'
+                )
+                raise error
+
+        blobs: Dict[int, Dict[str, Any]] = {}
+        for start in range(0, len(content_urls), _GRAPHQL_BATCH_SIZE):
+            blobs.update(
+                self.__get_blobs_by_graphql(
+                    content_urls,
+                    range(start, min(start + _GRAPHQL_BATCH_SIZE, len(content_urls)))
+                )
+            )
+
+        return [
+            self.__get_file_from_blob(content_url, blobs.get(i))
+            for i, content_url in enumerate(content_urls)
+        ]
+
+    def __get_file_from_blob(
+        self,
+        content_url: GitHubContentUrl,
+        blob: Optional[Dict[str, Any]]
+    ) -> WorkInfo:
+        if blob is None:
+            return self.get_file_from_url(content_url)
+
+        # GitHub returns the beginning of the big blobs and no text of
+        # the binary ones, so they are requested in the raw form
+        if blob['text'] is None or blob['isTruncated'] or blob['isBinary']:
+            return self.get_file_content_from_sha(
+                content_url.owner, content_url.repo, blob['oid'], content_url
+            )
+
+        return WorkInfo(blob['text'], content_url)
+
+    def __get_blobs_by_graphql(
+        self,
+        content_urls: List[GitHubContentUrl],
+        indexes: range
+    ) -> Dict[int, Dict[str, Any]]:
+        '''
+            Function returns the resolved blobs by the indexes of their files
+            @param content_urls - urls of the files
+            @param indexes - indexes of the urls requested by one query
+        '''
+        repos: Dict[Tuple[str, str], List[int]] = {}
+        for i in indexes:
+            repos.setdefault(
+                (content_urls[i].owner, content_urls[i].repo), []
+            ).append(i)
+
+        # Strings in GraphQL are escaped the same as in JSON
+        query_repos: List[str] = []
+        for repo_num, ((owner, repo), repo_indexes) in enumerate(repos.items()):
+            query_files = ' '.join(
+                f'f{i}: object(expression: '
+                f'{json.dumps(f"{content_urls[i].branch}:{content_urls[i].path}")}) '
+                '{ ... on Blob { oid text isTruncated isBinary } }'
+                for i in repo_indexes
+            )
+            query_repos.append(
+                f'r{repo_num}: repository(owner: {json.dumps(owner)}, '
+                f'name: {json.dumps(repo)}) {{ {query_files} }}'
+            )
+        response_json = self.send_graphql_request(
+            f"query {{ {' '.join(query_repos)} }}"
+        )
+        if response_json.get('errors'):
+            self.logger.debug(
+                "GraphQL errors, the not resolved files are requested "
+                f"through REST API: {response_json['errors']}"
+            )
+
+        data: Dict[str, Any] = response_json.get('data') or {}
+        blobs: Dict[int, Dict[str, Any]] = {}
+        for repo_num, repo_indexes in enumerate(repos.values()):
+            repository: Dict[str, Any] = data.get(f'r{repo_num}') or {}
+            for i in repo_indexes:
+                # The object is null for the missing paths and empty for
+                # the paths which aren't files
+                blob: Dict[str, Any] = repository.get(f'f{i}') or {}
+                if blob:
+                    blobs[i] = blob
+
+        return blobs
+
     def get_files_generator_from_dir_url(
         self,
         dir_url: str,
-        path_regexp: Optional[re.Pattern] = None
+        path_regexp: Optional[Union[str, Pattern]] = None
     ) -> Iterator[WorkInfo]:
+        if isinstance(path_regexp, str):
+            path_regexp = _compile(path_regexp)
         try:
             dir_url = GitHubContentUrl(dir_url)
         except ValueError as error:
@@ -365,8 +783,12 @@ class GitHubParser:
         params = {
             'ref': dir_url.branch
         }
-        response_json = self.send_get_request(api_url, params=params).json()
+        response_json = _load_json(self.send_get_request(api_url, params=params))
 
+        # The files between the subdirectories are requested by the window
+        # of __get_files_from_blobs, and the subdirectories are walked lazily
+        # in the order of the listing
+        blobs: List[Tuple[str, str]] = []
         for node in response_json:
             current_path = "/" + node["path"]
             full_link = (
@@ -376,6 +798,10 @@ class GitHubParser:
             )
             node_type = node["type"]
             if node_type == "dir":
+                yield from self.__get_files_from_blobs(
+                    dir_url.owner, dir_url.repo, iter(blobs)
+                )
+                blobs = []
                 yield from self.get_files_generator_from_sha_commit(
                     owner=dir_url.owner,
                     repo=dir_url.repo,
@@ -387,13 +813,15 @@ class GitHubParser:
             if (
                 node_type != "file"
                 or not self.is_accepted_extension(node["name"])
-                or (path_regexp is not None and path_regexp.search(full_link) is None)
+                or (
+                    path_regexp is not None
+                    and path_regexp.search(full_link) is None
+                )
             ):
                 continue
 
-            yield self.get_file_content_from_sha(
-                owner=dir_url.owner,
-                repo=dir_url.repo,
-                sha=node["sha"],
-                file_path=full_link,
-            )
+            blobs.append((node["sha"], full_link))
+
+        yield from self.__get_files_from_blobs(
+            dir_url.owner, dir_url.repo, iter(blobs)
+        )
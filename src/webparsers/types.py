@@ -1,4 +1,4 @@
-from typing import List, NamedTuple, Pattern, Tuple, Type, TypeVar
+from typing import List, NamedTuple, Pattern, Tuple, Type, TypeVar, Union
 
 from typing_extensions import Self
 
@@ -87,4 +87,5 @@ class WorkInfo(NamedTuple):
     link: str  # TODO: use urlib for type or requests
 
 
-Extensions = Tuple[Pattern, ...]
+# Extensions without the dot or regular expressions for the file paths
+Extensions = Tuple[Union[str, Pattern], ...]
@@ -1,11 +1,15 @@
 import json
 import os
-import re
-import shutil
-from contextlib import suppress
+from pathlib import Path
 
 import pytest
-from utils import SUCCESS_CODE, modify_settings, run_check, run_util
+from utils import (
+    SUCCESS_CODE,
+    modify_settings,
+    run_check,
+    run_check_batch,
+    run_util,
+)
 
 from codeplag.consts import UTIL_NAME, UTIL_VERSION
 from codeplag.types import WorksReport
@@ -24,7 +28,6 @@ PY_DIRS = [
     'test/unit'
 ]
 REPO_URL = 'https://github.com/OSLL/code-plagiarism'
-REPORTS_FOLDER = os.path.abspath('./reports')
 CPP_GITHUB_FILES = [
     f'{REPO_URL}/blob/main/test/unit/codeplag/cplag/data/sample3.cpp',
     f'{REPO_URL}/blob/main/test/unit/codeplag/cplag/data/sample4.cpp'
@@ -35,6 +38,53 @@ PY_GITHUB_FILES = [
 ]
 CPP_GITHUB_DIR = f'{REPO_URL}/tree/main/test'
 PY_GITHUB_DIR = f'{REPO_URL}/blob/main/src/codeplag/pyplag'
+JOBS = str(os.cpu_count() or 1)
+REPORT_KEYS = frozenset(WorksReport.__annotations__)
+CPP_CASES = [
+    (['--files', *CPP_FILES], 'Getting works features from files'),
+    (
+        ['--directories', CPP_DIR, '--jobs', JOBS],
+        f'Getting works features from {CPP_DIR}'
+    ),
+    (
+        ['--github-files', *CPP_GITHUB_FILES],
+        'Getting works features from GitHub urls'
+    ),
+    (
+        ['--github-project-folders', CPP_GITHUB_DIR],
+        f'Getting works features from {CPP_GITHUB_DIR}'
+    ),
+    (
+        ['--github-user', 'OSLL', '--repo-regexp', 'code-plag'],
+        f'Getting works features from {REPO_URL}'
+    )
+]
+PY_CASES = [
+    (
+        ['--files', *PY_FILES],
+        'Getting works features from files'
+    ),
+    (
+        ['--directories', *PY_DIRS, '--jobs', JOBS],
+        f'Getting works features from {PY_DIRS[0]}'
+    ),
+    (
+        ['--github-files', *PY_GITHUB_FILES],
+        'Getting works features from GitHub urls'
+    ),
+    (
+        ['--github-project-folders', PY_GITHUB_DIR],
+        f'Getting works features from {PY_GITHUB_DIR}'
+    ),
+    (
+        ['--github-user', 'OSLL', '--repo-regexp', 'code-plag'],
+        f'Getting works features from {REPO_URL}'
+    ),
+    (
+        ['--directories', *PY_DIRS, '--mode', 'one_to_one'],
+        f'Getting works features from {PY_DIRS[0]}',
+    )
+]
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -45,87 +95,48 @@ def setup_session():
     assert first_cond or second_cond
 
 
+@pytest.fixture
+def reports_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp('reports')
+
+
+@pytest.fixture(scope='module')
+def cpp_results():
+    cmds = [cmd for cmd, _ in CPP_CASES]
+    return dict(zip(map(tuple, cmds), run_check_batch(cmds, extension='cpp')))
+
+
+@pytest.fixture(scope='module')
+def py_results():
+    cmds = [cmd for cmd, _ in PY_CASES]
+    return dict(zip(map(tuple, cmds), run_check_batch(cmds)))
+
+
 def test_check_util_version():
     result = run_util(['--version'])
 
     assert result.returncode == SUCCESS_CODE
-    assert f'{UTIL_NAME} {UTIL_VERSION}' in result.stdout.decode('utf-8')
-
-
-@pytest.mark.parametrize(
-    "cmd, out",
-    [
-        (['--files', *CPP_FILES], b'Getting works features from files'),
-        (
-            ['--directories', CPP_DIR],
-            f'Getting works features from {CPP_DIR}'.encode('utf-8')
-        ),
-        (
-            ['--github-files', *CPP_GITHUB_FILES],
-            b'Getting works features from GitHub urls'
-        ),
-        (
-            ['--github-project-folders', CPP_GITHUB_DIR],
-            f'Getting works features from {CPP_GITHUB_DIR}'.encode('utf-8')
-        ),
-        (
-            ['--github-user', 'OSLL', '--repo-regexp', 'code-plag'],
-            f'Getting works features from {REPO_URL}'.encode('utf-8')
-        )
-    ]
-)
-def test_compare_cpp_files(cmd, out):
-    result = run_check(
-        cmd,
-        extension='cpp'
-    )
+    assert f'{UTIL_NAME} {UTIL_VERSION}' in result.stdout
+
+
+@pytest.mark.parametrize("cmd, out", CPP_CASES)
+def test_compare_cpp_files(cpp_results, cmd, out):
+    result = cpp_results[tuple(cmd)]
 
     assert result.returncode == SUCCESS_CODE
     assert out in result.stdout
 
 
-@pytest.mark.parametrize(
-    "cmd, out",
-    [
-        (
-            ['--files', *PY_FILES],
-            b'Getting works features from files'
-        ),
-        (
-            ['--directories', *PY_DIRS],
-            f'Getting works features from {PY_DIRS[0]}'.encode('utf-8')
-        ),
-        (
-            ['--github-files', *PY_GITHUB_FILES],
-            b'Getting works features from GitHub urls'
-        ),
-        (
-            ['--github-project-folders', PY_GITHUB_DIR],
-            f'Getting works features from {PY_GITHUB_DIR}'.encode('utf-8')
-        ),
-        (
-            ['--github-user', 'OSLL', '--repo-regexp', 'code-plag'],
-            f'Getting works features from {REPO_URL}'.encode('utf-8')
-        ),
-        (
-            ['--directories', *PY_DIRS, '--mode', 'one_to_one'],
-            f'Getting works features from {PY_DIRS[0]}'.encode('utf-8'),
-        )
-    ]
-)
-def test_compare_py_files(cmd, out):
-    result = run_check(cmd)
+@pytest.mark.parametrize("cmd, out", PY_CASES)
+def test_compare_py_files(py_results, cmd, out):
+    result = py_results[tuple(cmd)]
 
     assert result.returncode == SUCCESS_CODE
     assert out in result.stdout
 
 
-def test_save_reports():
-    with suppress(Exception):
-        os.mkdir(REPORTS_FOLDER)
-    assert os.path.exists(REPORTS_FOLDER)
-
-    assert modify_settings(REPORTS_FOLDER).returncode == 0
+def test_save_reports(reports_dir: Path):
+    assert modify_settings(reports_dir).returncode == 0
     assert run_check(
         [
             '--directories',
@@ -135,15 +146,11 @@ def test_save_reports():
             './test/auto/test_bugs.py'
         ]
     ).returncode == 0
-    reports_files = os.listdir(REPORTS_FOLDER)
-
-    assert len(reports_files) > 0
-    for file in reports_files:
-        assert re.search('.*[.]json$', file)
-        filepath = f'{REPORTS_FOLDER}/{file}'
-        with open(filepath, 'r') as f:
-            report = json.loads(f.read())
-            for key in WorksReport.__annotations__.keys():
-                assert key in report
-
-    shutil.rmtree(REPORTS_FOLDER)
+    reports = list(reports_dir.iterdir())
+
+    assert len(reports) > 0
+    for report_path in reports:
+        assert report_path.suffix == '.json'
+        with report_path.open('rb') as f:
+            report = json.load(f)
+            assert REPORT_KEYS <= report.keys()
@@ -28,10 +28,10 @@ def test_modify_settings(env, reports, threshold, show_progress):
     )
     assert result.returncode == 0
 
-    assert bytes(env, encoding='utf-8') in result.stdout
-    assert bytes(reports, encoding='utf-8') in result.stdout
-    assert bytes(str(threshold), encoding='utf-8') in result.stdout
-    assert bytes(str(show_progress), encoding='utf-8') in result.stdout
+    assert env in result.stdout
+    assert reports in result.stdout
+    assert str(threshold) in result.stdout
+    assert str(show_progress) in result.stdout
 
 
 @pytest.mark.parametrize(
@@ -1,15 +1,62 @@
+import io
+import os
 import subprocess
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import List, Literal, Optional, Union
 
+from codeplag import main
 from codeplag.consts import UTIL_NAME
 from codeplag.types import Flag
 
 SUCCESS_CODE = 0
+# The util is called in the current interpreter, so its modules and libclang
+# are loaded once per test session. Set USE_SUBPROCESS=1 to run the installed
+# entry point in separate processes instead, where the commands of a batch
+# are run concurrently.
+USE_SUBPROCESS = os.environ.get('USE_SUBPROCESS', '') == '1'
+# The limit of the util processes run at once, since each of them may send
+# requests to the GitHub API and many concurrent requests trip its
+# secondary rate limits
+MAX_PROCESSES = 4
 
 
 def run_cmd(cmd: List[str]) -> subprocess.CompletedProcess:
-    return subprocess.run(cmd, stdout=subprocess.PIPE)
+    return subprocess.run(cmd, capture_output=True, text=True, check=False)
+
+
+def run_cmds(cmds: List[List[str]]) -> List[subprocess.CompletedProcess]:
+    results = []
+    for start in range(0, len(cmds), MAX_PROCESSES):
+        processes = [
+            subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            )
+            for cmd in cmds[start:start + MAX_PROCESSES]
+        ]
+        for process in processes:
+            stdout, stderr = process.communicate()
+            results.append(
+                subprocess.CompletedProcess(
+                    process.args, process.returncode, stdout, stderr
+                )
+            )
+
+    return results
+
+
+def run_main(args: List[str]) -> subprocess.CompletedProcess:
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            returncode = main(args)
+        except SystemExit as err:
+            returncode = 1 if isinstance(err.code, str) else err.code or 0
+
+    return subprocess.CompletedProcess(
+        [UTIL_NAME] + args, returncode, stdout.getvalue(), stderr.getvalue()
+    )
 
 
 def run_util(
@@ -17,13 +64,35 @@ def run_util(
     root: Optional[Literal["check", "settings"]] = None
 ) -> subprocess.CompletedProcess:
     command = [] if root is None else [root]
-    return run_cmd([UTIL_NAME] + command + cmd)
+    if USE_SUBPROCESS:
+        return run_cmd([UTIL_NAME] + command + cmd)
+
+    return run_main(command + cmd)
+
+
+def run_util_batch(
+    cmds: List[List[str]],
+    root: Optional[Literal["check", "settings"]] = None
+) -> List[subprocess.CompletedProcess]:
+    command = [] if root is None else [root]
+    if USE_SUBPROCESS:
+        return run_cmds([[UTIL_NAME] + command + cmd for cmd in cmds])
+
+    return [run_main(command + cmd) for cmd in cmds]
 
 
 def run_check(cmd: List[str], extension: str = 'py') -> subprocess.CompletedProcess:
     return run_util(['--extension', extension] + cmd, root="check")
 
 
+def run_check_batch(
+    cmds: List[List[str]], extension: str = 'py'
+) -> List[subprocess.CompletedProcess]:
+    return run_util_batch(
+        [['--extension', extension] + cmd for cmd in cmds], root="check"
+    )
+
+
 def modify_settings(
     reports: Optional[Union[Path, str]] = None,
     environment: Optional[Union[Path, str]] = None,
@@ -0,0 +1,67 @@
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from codeplag import astcache
+from codeplag.cplag.const import COMPILE_ARGS
+from codeplag.cplag.tree import get_features
+from codeplag.cplag.utils import (
+    get_cursor_from_content,
+    get_cursor_from_file,
+    get_work_from_filepath,
+    has_local_includes,
+)
+
+CWD = Path(os.path.dirname(os.path.abspath(__file__)))
+FILEPATH1 = CWD / './data/sample1.cpp'
+
+
+def test_get_cursor_from_content(tmp_path: Path):
+    filepath = tmp_path / 'download.cpp'
+    expected = get_features(
+        get_cursor_from_file(FILEPATH1, COMPILE_ARGS), FILEPATH1
+    )
+
+    cursor = get_cursor_from_content(
+        FILEPATH1.read_text(), filepath, COMPILE_ARGS
+    )
+    features = get_features(cursor, filepath)
+
+    # The source code is parsed from memory without creating the file
+    assert not filepath.exists()
+    assert features.tokens == expected.tokens
+    assert features.head_nodes == expected.head_nodes
+    assert features.structure == expected.structure
+
+
+@pytest.mark.parametrize(
+    "source, expected_result",
+    [
+        (b'#include <iostream>\nint main() {}\n', False),
+        (b'#include "utils.h"\nint main() {}\n', True),
+        (b'int main() {}\n  #  include "utils.h"\n', True),
+        (b'// #include "utils.h"\nint main() {}\n', False),
+    ]
+)
+def test_has_local_includes(source: bytes, expected_result: bool):
+    assert has_local_includes(source) is expected_result
+
+
+def test_get_work_from_filepath_local_includes(mocker: MockerFixture, tmp_path: Path):
+    cache_path = tmp_path / 'cache'
+    mocker.patch.object(astcache, 'AST_CACHE_PATH', cache_path)
+    header = tmp_path / 'utils.h'
+    header.write_text('int square(int x) { return x * x; }\n')
+    filepath = tmp_path / 'main.cpp'
+    filepath.write_text('#include "utils.h"\nint main() { return square(2); }\n')
+
+    get_work_from_filepath(filepath, COMPILE_ARGS)
+
+    # The features depend on the header, so they aren't cached
+    assert not cache_path.exists()
+
+    get_work_from_filepath(FILEPATH1, COMPILE_ARGS)
+
+    assert len(list(astcache.get_cache_dir().iterdir())) == 1
@@ -0,0 +1,23 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from codeplag.pyplag.utils import get_works_from_filepaths
+
+CWD = Path(os.path.dirname(os.path.abspath(__file__)))
+FILEPATHS = [
+    CWD / '../data/test1.py',
+    CWD / '../data/test2.py',
+    CWD / '../data/test3.py',
+]
+
+
+@pytest.mark.parametrize("jobs", [2, 4])
+def test_get_works_from_filepaths_jobs(jobs: int):
+    expected = get_works_from_filepaths(FILEPATHS, use_ast_cache=False)
+
+    works = get_works_from_filepaths(FILEPATHS, jobs=jobs, use_ast_cache=False)
+
+    assert len(works) == len(FILEPATHS)
+    assert works == expected
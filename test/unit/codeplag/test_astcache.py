@@ -0,0 +1,162 @@
+import os
+import platform
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from codeplag import astcache
+from codeplag.astcache import (
+    CACHE_FORMAT_VERSION,
+    deserialize_features,
+    get_cache_file,
+    get_cache_key,
+    get_parser_version,
+    load_features,
+    prune_cache,
+    save_features,
+    serialize_features,
+)
+from codeplag.pyplag.utils import get_ast_from_filename, get_features_from_ast
+
+CWD = Path(os.path.dirname(os.path.abspath(__file__)))
+FILEPATH1 = CWD / './data/test1.py'
+FILEPATH2 = CWD / './data/test2.py'
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path, mocker: MockerFixture) -> Path:
+    mocker.patch.object(astcache, 'AST_CACHE_PATH', tmp_path)
+
+    return tmp_path
+
+
+def test_get_cache_key():
+    source = FILEPATH1.read_bytes()
+
+    assert get_cache_key(source, 'py') == get_cache_key(source, 'py')
+    assert get_cache_key(source, 'py') != get_cache_key(source, 'cpp')
+    assert get_cache_key(source, 'py') != get_cache_key(source + b'\n', 'py')
+
+
+def test_get_cache_key_compile_args():
+    source = FILEPATH1.read_bytes()
+    key = get_cache_key(source, 'cpp', ['-x', 'c++', b'-I/usr/include'])
+
+    assert get_cache_key(source, 'cpp', ['-x', 'c++', b'-I/usr/include']) == key
+    assert get_cache_key(source, 'cpp', ['-x', 'c++']) != key
+    assert get_cache_key(source, 'cpp') != key
+
+
+def test_get_cache_key_parser_version(mocker: MockerFixture):
+    source = FILEPATH1.read_bytes()
+    key = get_cache_key(source, 'cpp')
+    mocker.patch.object(astcache, 'get_parser_version', return_value='15.0.0')
+
+    assert get_cache_key(source, 'cpp') != key
+
+
+def test_get_parser_version(mocker: MockerFixture):
+    mocker.patch.object(astcache, 'version', return_value='14.0.6')
+    get_parser_version.cache_clear()
+
+    assert get_parser_version('cpp') == '14.0.6'
+    assert get_parser_version('py') == platform.python_version()
+
+    get_parser_version.cache_clear()
+
+
+def test_save_and_load_features(cache_path: Path):
+    source = FILEPATH1.read_bytes()
+    tree = get_ast_from_filename(FILEPATH1)
+    assert tree is not None
+    features = get_features_from_ast(tree, FILEPATH1)
+
+    assert load_features(source, 'py', FILEPATH1) is None
+
+    save_features(source, 'py', features)
+    assert len(list(cache_path.joinpath(f'v{CACHE_FORMAT_VERSION}').iterdir())) == 1
+
+    loaded = load_features(source, 'py', 'https://github.com/OSLL/test1.py')
+    assert loaded is not None
+    features.filepath = 'https://github.com/OSLL/test1.py'
+    assert loaded == features
+
+    assert load_features(FILEPATH2.read_bytes(), 'py', FILEPATH2) is None
+    assert load_features(source, 'cpp', FILEPATH1) is None
+
+
+def test_load_broken_features(cache_path: Path):
+    source = FILEPATH1.read_bytes()
+    cache_file = get_cache_file(source, 'py')
+    cache_file.parent.mkdir()
+    cache_file.write_bytes(b'broken')
+
+    assert load_features(source, 'py', FILEPATH1) is None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'',
+        bytes((CACHE_FORMAT_VERSION + 1,)) + b'data',
+        bytes((CACHE_FORMAT_VERSION,)) + b'broken',
+        bytes((CACHE_FORMAT_VERSION,)),
+    ]
+)
+def test_deserialize_broken_features(data: bytes):
+    assert deserialize_features(data, FILEPATH1) is None
+
+
+def test_serialize_features():
+    tree = get_ast_from_filename(FILEPATH2)
+    assert tree is not None
+    features = get_features_from_ast(tree, FILEPATH2)
+
+    data = serialize_features(features)
+
+    assert data[0] == CACHE_FORMAT_VERSION
+    assert deserialize_features(data, FILEPATH2) == features
+
+
+def test_save_features_unwritable(mocker: MockerFixture):
+    mocker.patch.object(astcache, 'AST_CACHE_PATH', Path('/proc/bad_dir'))
+    tree = get_ast_from_filename(FILEPATH1)
+    assert tree is not None
+    features = get_features_from_ast(tree, FILEPATH1)
+
+    save_features(FILEPATH1.read_bytes(), 'py', features)
+
+
+def test_prune_cache(cache_path: Path):
+    source = FILEPATH1.read_bytes()
+    tree = get_ast_from_filename(FILEPATH1)
+    assert tree is not None
+    save_features(source, 'py', get_features_from_ast(tree, FILEPATH1))
+    (cache_path / 'old.pkl').write_bytes(b'old')
+    (cache_path / 'v0').mkdir()
+    (cache_path / 'v0' / 'old.bin').write_bytes(b'old')
+
+    prune_cache()
+
+    assert list(cache_path.iterdir()) == [cache_path / f'v{CACHE_FORMAT_VERSION}']
+    assert load_features(source, 'py', FILEPATH1) is not None
+
+
+def test_prune_missing_cache(mocker: MockerFixture, tmp_path: Path):
+    mocker.patch.object(astcache, 'AST_CACHE_PATH', tmp_path / 'missing')
+
+    prune_cache()
+
+
+def test_prune_cache_size(cache_path: Path):
+    cache_dir = cache_path / f'v{CACHE_FORMAT_VERSION}'
+    cache_dir.mkdir()
+    for i in range(4):
+        entry = cache_dir / f'{i}.bin'
+        entry.write_bytes(bytes(100))
+        os.utime(entry, (i, i))
+
+    prune_cache(max_size=250)
+
+    assert sorted(entry.name for entry in cache_dir.iterdir()) == ['2.bin', '3.bin']
@@ -2,7 +2,7 @@ import argparse
 
 import pytest
 
-from codeplag.codeplagcli import CodeplagCLI, DirPath, FilePath
+from codeplag.codeplagcli import CodeplagCLI, DirPath, FilePath, positive_int
 
 
 @pytest.mark.parametrize(
@@ -53,6 +53,30 @@ def test_file_path_bad(path):
         FilePath(path)
 
 
+@pytest.mark.parametrize(
+    "value, out",
+    [
+        ('1', 1),
+        ('16', 16)
+    ]
+)
+def test_positive_int(value, out):
+    assert positive_int(value) == out
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ('0'),
+        ('-2'),
+        ('two'),
+    ]
+)
+def test_positive_int_bad(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)
+
+
 @pytest.mark.parametrize(
     'args, raises',
     [
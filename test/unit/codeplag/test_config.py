@@ -3,6 +3,7 @@ import logging
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import orjson
 import pytest
 from pytest_mock import MockerFixture
 
@@ -24,8 +25,8 @@ def mock_json_load(request, mocker: MockerFixture) -> dict:
 
 
 @pytest.fixture
-def mock_json_dump(mocker: MockerFixture) -> MagicMock:
-    return mocker.patch.object(json, 'dump')
+def mock_orjson_dumps(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch.object(orjson, 'dumps', return_value=b'{}')
 
 
 @pytest.fixture
@@ -108,11 +109,11 @@ def test_read_config_bad(path, except_type):
         ],
     ]
 )
-def test_write_config(path, mock_json_dump, dumped_dict, expected):
+def test_write_config(path, mock_orjson_dumps, dumped_dict, expected):
     copy_dumped = dict(dumped_dict)
     write_config(path, dumped_dict)
-    mock_json_dump.assert_called_once()
-    assert mock_json_dump.mock_calls[0].args[0] == expected
+    mock_orjson_dumps.assert_called_once()
+    assert mock_orjson_dumps.mock_calls[0].args[0] == expected
     assert copy_dumped == dumped_dict
 
 
@@ -129,6 +130,7 @@ def test_read_default_settings_conf(dummy_logger, settings_config):
         [
             {'reports': '/home/bukabyka/reports'},
             {
+                'ast_cache': 1,
                 'threshold': 65,
                 'reports': Path('/home/bukabyka/reports'),
                 'show_progress': 0
@@ -142,6 +144,7 @@ def test_read_default_settings_conf(dummy_logger, settings_config):
                 'show_progress': 1
             },
             {
+                'ast_cache': 1,
                 'threshold': 99,
                 'environment': Path('/home/bukabyka/.env'),
                 'show_progress': 1
@@ -150,6 +153,7 @@ def test_read_default_settings_conf(dummy_logger, settings_config):
         [
             {'bad_field': 'bad_field', 'reports': '/home/bukabyka/reports'},
             {
+                'ast_cache': 1,
                 'threshold': 65,
                 'reports': Path('/home/bukabyka/reports'),
                 'show_progress': 0
@@ -0,0 +1,53 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from codeplag.getfeatures import classify_extension, get_files_path_from_directory
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ('main.py', 'py'),
+        ('module.in.py', 'py'),
+        ('main.cpp', 'cpp'),
+        ('main.c', 'cpp'),
+        ('header.h', 'cpp'),
+        ('Makefile', None),
+        ('main.pyc', None),
+        ('main.hpp', None),
+    ]
+)
+def test_classify_extension(filename, expected):
+    assert classify_extension(filename) == expected
+
+
+@pytest.fixture
+def work_dir(tmp_path: Path) -> Path:
+    (tmp_path / 'src').mkdir()
+    for filename in ('main.py', 'src/utils.py', 'src/main.cpp', 'src/Makefile'):
+        (tmp_path / filename).touch()
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "extension, path_regexp, expected",
+    [
+        (None, None, ['main.py', 'src/main.cpp', 'src/utils.py']),
+        ('py', None, ['main.py', 'src/utils.py']),
+        ('cpp', None, ['src/main.cpp']),
+        ('py', r'src/', ['src/utils.py']),
+    ]
+)
+def test_get_files_path_from_directory(work_dir, extension, path_regexp, expected):
+    files = get_files_path_from_directory(
+        work_dir,
+        extension=extension,
+        path_regexp=re.compile(path_regexp) if path_regexp else None
+    )
+
+    assert sorted(
+        path.relative_to(work_dir).as_posix() for path in files
+    ) == expected
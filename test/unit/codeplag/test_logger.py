@@ -0,0 +1,18 @@
+import io
+import logging
+from contextlib import redirect_stdout
+
+from codeplag.logger import get_stream_handler
+
+
+def test_stream_handler_writes_to_current_stdout():
+    handler = get_stream_handler()
+    record = logging.makeLogRecord(
+        {'msg': 'Some message', 'levelno': logging.INFO, 'levelname': 'INFO'}
+    )
+
+    stdout = io.StringIO()
+    with redirect_stdout(stdout):
+        handler.handle(record)
+
+    assert 'Some message' in stdout.getvalue()
@@ -1,1096 +1,1964 @@
-import base64
-import io
 import re
-import unittest
-from contextlib import redirect_stdout
-from typing import Optional, Union
-from unittest.mock import call, patch
-
-from webparsers.github_parser import GitHubParser
-from webparsers.types import Branch, PullRequest, Repository
-
-
-class Response:
-    def __init__(self, response_json: Optional[Union[list, dict]] = None,
-                 status_code: int = 200, message: Optional[str] = None):
-        self.status_code = status_code
-        self.message = message
-        self.response_json = response_json if response_json else {}
-        if self.message and isinstance(self.response_json, dict):
-            self.response_json.update(
-                {'message': self.message}
-            )
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Hashable, Optional, Union
+from unittest.mock import Mock, call
+
+import orjson
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from webparsers import github_parser
+from webparsers.github_parser import GitHubParser, get_extension_suffixes
+from webparsers.types import Branch, PullRequest, Repository, WorkInfo
+
+
+def make_response(payload: Optional[Union[list, dict]] = None,
+                  status: int = 200, message: Optional[str] = None,
+                  etag: Optional[str] = None,
+                  links: Optional[dict] = None) -> Mock:
+    # The named mock isn't attached to the mock returning it, so its calls
+    # aren't recorded in the mock_calls of the patched methods
+    response = Mock(spec=requests.Response, name='Response')
+    response.status_code = status
+    response.headers = {'ETag': etag} if etag else {}
+    response.links = links if links else {}
+    if payload is None:
+        payload = {}
+    if message and isinstance(payload, dict):
+        payload = {**payload, 'message': message}
+    response.content = orjson.dumps(payload)
+    response.raise_for_status.return_value = None
+
+    return response
+
+
+def get_empty_response() -> Mock:
+    # A new response per call, so no test sees the calls made by another one
+    return make_response([])
+
+
+def get_page_links(last_page: int) -> dict:
+    '''
+        Returns the parsed Link header of the first page of the paginated
+        list with the last_page pages
+    '''
+    url = 'https://api.github.com/resource?per_page=100&page={}'
+
+    return {
+        'next': {'url': url.format(2), 'rel': 'next'},
+        'last': {'url': url.format(last_page), 'rel': 'last'},
+    }
+
+
+def side_effect_by_call(calls, responses):
+    '''
+        Returns side effect for the mock which is called concurrently,
+        it responds to the calls in any order and returns the empty response
+        to the calls without the response
+    '''
+    def side_effect(*args, **kwargs):
+        for expected_call, response in zip(calls, responses):
+            if expected_call == call(*args, **kwargs):
+                return response
+
+        return get_empty_response()
+
+    return side_effect
+
+
+def assert_calls(mock, calls):
+    mock.assert_has_calls(calls)
+    assert mock.call_count == len(calls)
+
+
+def freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+
+    return value
+
+
+def normalize_call(mock_call: Any) -> Hashable:
+    return freeze(mock_call.args), freeze(mock_call.kwargs)
+
+
+def assert_calls_in_any_order(mock, calls):
+    # The calls are compared as multisets, since the order of the concurrent
+    # calls varies
+    assert Counter(map(normalize_call, mock.call_args_list)) == Counter(
+        map(normalize_call, calls)
+    )
+
+
+@pytest.fixture(scope='module')
+def parser() -> GitHubParser:
+    return GitHubParser()
+
+
+@pytest.fixture(scope='module')
+def token_parser() -> GitHubParser:
+    return GitHubParser(access_token='test_token')
+
+
+@pytest.fixture(scope='module')
+def check_all_parser() -> GitHubParser:
+    return GitHubParser(check_all=True)
 
-    def json(self):
-        return self.response_json
 
-    def raise_for_status(self):
-        return None
+@pytest.fixture(scope='module')
+def extensions_parser(request: pytest.FixtureRequest) -> GitHubParser:
+    return GitHubParser(file_extensions=request.param)
 
 
-class TestGitHubParser(unittest.TestCase):
+@pytest.fixture(autouse=True)
+def clear_cache(parser, token_parser, check_all_parser) -> None:
+    # The parsers are shared by the tests of the module, while the payloads
+    # cached by get_json must not leak from one test to another
+    for shared_parser in (parser, token_parser, check_all_parser):
+        shared_parser._cache.clear()
 
-    @classmethod
-    def setUpClass(cls):
-        cls.maxDiff = None
 
-    def test_is_accepted_extension(self):
-        test_cases = [
+@pytest.mark.parametrize(
+    "extensions_parser, arguments, expected_result",
+    [
+        (
+            None,
             {
-                'arguments': {
-                    'path': 'some/path/module.py'
-                },
-                'parser': GitHubParser(),
-                'expected_result': True
+                'path': 'some/path/module.py'
             },
+            True,
+        ),
+        (
+            None,
             {
-                'arguments': {
-                    'path': 'some/path/module.cpp'
-                },
-                'parser': GitHubParser(),
-                'expected_result': True
+                'path': 'some/path/module.cpp'
             },
+            True,
+        ),
+        (
+            None,
             {
-                'arguments': {
-                    'path': 'some/path/module.c'
-                },
-                'parser': GitHubParser(),
-                'expected_result': True
+                'path': 'some/path/module.c'
             },
+            True,
+        ),
+        (
+            None,
             {
-                'arguments': {
-                    'path': 'some/path/module.in.py'
-                },
-                'parser': GitHubParser(),
-                'expected_result': True
+                'path': 'some/path/module.in.py'
             },
+            True,
+        ),
+        (
+            (re.compile('py'),),
             {
-                'arguments': {
-                    'path': 'some/path/module.c'
-                },
-                'parser': GitHubParser(
-                    file_extensions=(re.compile('py'),)
-                ),
-                'expected_result': False
+                'path': 'some/path/module.c'
             },
+            False,
+        ),
+        (
+            (re.compile('cpp'), re.compile('c')),
             {
-                'arguments': {
-                    'path': 'some/path/module.in'
-                },
-                'parser': GitHubParser(
-                    file_extensions=(re.compile('cpp'), re.compile('c'),)
-                ),
-                'expected_result': False
+                'path': 'some/path/module.in'
             },
-        ]
+            False,
+        ),
+        (
+            ('py',),
+            {
+                'path': 'some/path/module.py'
+            },
+            True,
+        ),
+        (
+            ('py',),
+            {
+                'path': 'some/path/module.pyc'
+            },
+            False,
+        ),
+        (
+            ('py',),
+            {
+                'path': 'some/path/MODULE.PY'
+            },
+            False,
+        ),
+        (
+            ('py',),
+            {
+                'path': 'some/path.py/module'
+            },
+            False,
+        ),
+        (
+            ('gitignore',),
+            {
+                'path': 'some/path/.gitignore'
+            },
+            False,
+        ),
+        (
+            (re.compile(r'\.py$'), re.compile(r'\.(cpp|c|h)$')),
+            {
+                'path': 'some/path/module.h'
+            },
+            True,
+        ),
+        (
+            (re.compile(r'\.py$'), re.compile(r'\.(cpp|c|h)$')),
+            {
+                'path': 'some/path/module.hpp'
+            },
+            False,
+        ),
+        (
+            ('cpp', re.compile('py')),
+            {
+                'path': 'some/python/module.in'
+            },
+            True,
+        ),
+    ],
+    indirect=['extensions_parser']
+)
+def test_is_accepted_extension(extensions_parser, arguments, expected_result):
+    rv = extensions_parser.is_accepted_extension(**arguments)
+    assert rv == expected_result
 
-        for test_case in test_cases:
-            with self.subTest(test_case=test_case):
-                rv = test_case['parser'].is_accepted_extension(
-                    **test_case['arguments']
-                )
-                self.assertEqual(rv, test_case['expected_result'])
 
-    @patch('webparsers.github_parser.requests.get')
-    def test_send_get_request(self, mock_get):
-        test_cases = [
+@pytest.mark.parametrize(
+    "extension, expected_result",
+    [
+        ('py', ('.py',)),
+        (re.compile(r'\.py$'), ('.py',)),
+        (re.compile(r'\.(cpp|c|h)$'), ('.cpp', '.c', '.h')),
+        (re.compile('py'), None),
+        (re.compile(r'\.py'), None),
+        (re.compile(r'\.py$', re.IGNORECASE), None),
+    ]
+)
+def test_get_extension_suffixes(extension, expected_result):
+    assert get_extension_suffixes(extension) == expected_result
+
+
+@pytest.mark.parametrize(
+    "arguments, get_posargs, get_kwargs, response",
+    [
+        (
             {
-                'arguments': {
-                    'api_url': 'users/moevm/repos',
-                    'params': {}
-                },
-                'get_arguments': [
+                'api_url': 'users/moevm/repos',
+                'params': {}
+            },
+            ['https://api.github.com/users/moevm/repos'],
+            {
+                'params': {}
+            },
+            make_response(status=200),
+        ),
+    ]
+)
+def test_send_get_request(mocker: MockerFixture, arguments, get_posargs, get_kwargs,
+                          response):
+    mock_get = mocker.patch.object(requests.Session, 'get')
+    mock_get.return_value = response
 
-                ],
-                'get_posargs': ['https://api.github.com/users/moevm/repos'],
-                'get_kwargs': {
-                    'headers': {'accept': 'application/vnd.github.v3+json'},
-                    'params': {}
-                },
-                'response': Response(status_code=200)
+    # The successful responses are cached by the parser
+    rv = GitHubParser().send_get_request(**arguments)
+    assert rv == response
+
+    mock_get.assert_called_once_with(*get_posargs, **get_kwargs)
+
+
+@pytest.mark.parametrize(
+    "token, expected_headers",
+    [
+        ('', {'accept': 'application/vnd.github.v3+json'}),
+        (
+            'test_token',
+            {
+                'accept': 'application/vnd.github.v3+json',
+                'Authorization': 'token test_token'
             }
-        ]
+        ),
+    ]
+)
+def test_session_headers(parser, token_parser, token, expected_headers):
+    parser = token_parser if token else parser
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_get.reset_mock()
-            mock_get.return_value = test_case['response']
+    for header, value in expected_headers.items():
+        assert parser._session.headers[header] == value
+    if not token:
+        assert 'Authorization' not in parser._session.headers
 
-            with self.subTest(test_case=test_case):
-                rv = parser.send_get_request(**test_case['arguments'])
-                self.assertEqual(rv, test_case['response'])
 
-                mock_get.assert_called_once_with(*test_case['get_posargs'],
-                                                 **test_case['get_kwargs'])
+def test_session_retries(parser):
+    retries = parser._session.get_adapter('https://api.github.com').max_retries
 
-    @patch('webparsers.github_parser.requests.get')
-    def test_send_get_request_bad(self, mock_get):
-        test_cases = [
-            {
-                'arguments': {
-                    'api_url': 'Test/url',
-                    'params': {}
-                },
-                'get_arguments': [
+    assert retries.total == 5
+    assert retries.status_forcelist == [502, 503, 504]
+    assert retries.allowed_methods == {'GET'}
+    assert retries.respect_retry_after_header
 
-                ],
-                'get_posargs': ['https://api.github.com/Test/url'],
-                'get_kwargs': {
-                    'headers': {'accept': 'application/vnd.github.v3+json'},
-                    'params': {}
-                },
-                'response': Response(status_code=403, message="Not Found"),
-                'raised': SystemExit
+
+def test_session_retries_unavailable(mocker: MockerFixture):
+    mock_sleep = mocker.patch.object(Retry, 'sleep')
+    statuses = [503, 503, 200]
+    requested_paths = []
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested_paths.append(self.path)
+            body = b'{"default_branch": "main"}'
+            self.send_response(statuses[len(requested_paths) - 1])
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with GitHubParser() as parser:
+            # The local stub is served over HTTP, so the adapter of the API
+            # with its retries is mounted for it
+            parser._session.trust_env = False
+            parser._session.mount(
+                'http://', parser._session.get_adapter('https://api.github.com')
+            )
+            response = parser.send_get_request(
+                '/repos/OSLL/code-plagiarism',
+                address=f'http://127.0.0.1:{server.server_address[1]}'
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert response.status_code == 200
+    assert orjson.loads(response.content) == {'default_branch': 'main'}
+    assert requested_paths == ['/repos/OSLL/code-plagiarism'] * 3
+    assert mock_sleep.call_count == 2
+
+
+def test_session_reuse(mocker: MockerFixture):
+    mock_send = mocker.patch.object(HTTPAdapter, 'send', autospec=True)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{}'
+    mock_send.return_value = response
+
+    parser = GitHubParser()
+    parser.send_get_request('/repos/OSLL/code-plagiarism')
+    parser.send_get_request('/repos/OSLL/code-plagiarism/branches')
+
+    adapter = parser._session.get_adapter('https://api.github.com')
+    assert mock_send.call_count == 2
+    for send_call in mock_send.call_args_list:
+        assert send_call.args[0] is adapter
+
+
+def test_send_get_request_retries_exceeded(mocker: MockerFixture, parser):
+    mock_get = mocker.patch.object(requests.Session, 'get')
+    mock_get.side_effect = requests.exceptions.RetryError()
+
+    with pytest.raises(SystemExit):
+        parser.send_get_request('/repos/OSLL/code-plagiarism')
+
+    mock_get.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "arguments, token, get_posargs, get_kwargs, headers, response, raised",
+    [
+        (
+            {
+                'api_url': 'Test/url',
+                'params': {}
             },
+            '',
+            ['https://api.github.com/Test/url'],
             {
-                'arguments': {
-                    'api_url': 'bad/link',
-                    'params': {}
-                },
-                'get_posargs': ['https://api.github.com/bad/link'],
-                'get_kwargs': {
-                    'headers': {'accept': 'application/vnd.github.v3+json'},
-                    'params': {}
-                },
-                'response': Response(status_code=403),
-                'raised': KeyError
+                'params': {}
+            },
+            {},
+            make_response(status=403, message="Not Found"),
+            SystemExit,
+        ),
+        (
+            {
+                'api_url': 'bad/link',
+                'params': {}
+            },
+            '',
+            ['https://api.github.com/bad/link'],
+            {
+                'params': {}
+            },
+            {},
+            make_response(status=403),
+            KeyError,
+        ),
+        (
+            {
+                'api_url': 'bad/link',
+                'params': {
+                    'per_page': 100,
+                    'page': 5
+                }
             },
+            '',
+            ['https://api.github.com/bad/link'],
             {
-                'arguments': {
-                    'api_url': 'bad/link',
-                    'params': {
+                'params': {
+                    'per_page': 100,
+                    'page': 5
+                }
+            },
+            {},
+            make_response(status=403),
+            KeyError,
+        ),
+        (
+            {
+                'api_url': 'bad/link',
+                'params': {}
+            },
+            'test_token',
+            ['https://api.github.com/bad/link'],
+            {
+                'params': {}
+            },
+            {
+                'accept': 'application/vnd.github.v3+json',
+                'Authorization': 'token test_token'
+            },
+            make_response(status=403),
+            KeyError,
+        ),
+    ]
+)
+def test_send_get_request_bad(mocker: MockerFixture, parser, token_parser, arguments,
+                              token, get_posargs, get_kwargs, headers, response,
+                              raised):
+    mock_get = mocker.patch.object(requests.Session, 'get')
+    parser = token_parser if token else parser
+    mock_get.return_value = response
+
+    with pytest.raises(raised):
+        parser.send_get_request(**arguments)
+
+    mock_get.assert_called_once_with(*get_posargs, **get_kwargs)
+    for header, value in headers.items():
+        assert parser._session.headers[header] == value
+
+
+@pytest.mark.parametrize(
+    "arguments, send_calls, send_rvs, expected_result",
+    [
+        (
+            {
+                'owner': 'OSLL',
+                'reg_exp': None
+            },
+            [
+                call(
+                    '/users/OSLL/repos',
+                    params={
                         'per_page': 100,
-                        'page': 5
+                        'page': 1
                     }
-                },
-                'get_posargs': ['https://api.github.com/bad/link'],
-                'get_kwargs': {
-                    'headers': {'accept': 'application/vnd.github.v3+json'},
-                    'params': {
+                )
+            ],
+            [get_empty_response()],
+            [],
+        ),
+        (
+            {
+                'owner': 'OSLL',
+                'reg_exp': None
+            },
+            [
+                call(
+                    '/users/OSLL/repos',
+                    params={
                         'per_page': 100,
-                        'page': 5
+                        'page': 1
                     }
-                },
-                'response': Response(status_code=403),
-                'raised': KeyError
-            },
+                ),
+                call(
+                    '/users/OSLL/repos',
+                    params={
+                        'per_page': 100,
+                        'page': 2
+                    }
+                )
+            ],
+            [
+                make_response(
+                    [
+                        {
+                            'name': 'asm_web_debug',
+                            'html_url': 'https://github.com/OSLL/asm_web_debug'
+                        },
+                        {
+                            'name': 'aido-auto-feedback',
+                            'html_url': 'https://github.com/OSLL/aido-auto-feedback'
+                        }
+                    ],
+                    links=get_page_links(2)
+                ),
+                make_response(
+                    [
+                        {
+                            'name': 'MD-Code_generator',
+                            'html_url': 'https://github.com/OSLL/MD-Code_generator'
+                        },
+                        {
+                            'name': 'code-plagiarism',
+                            'html_url': 'https://github.com/OSLL/code-plagiarism'
+                        }
+                    ]
+                )
+            ],
+            [
+                Repository(
+                    'asm_web_debug',
+                    'https://github.com/OSLL/asm_web_debug'
+                ),
+                Repository(
+                    'aido-auto-feedback',
+                    'https://github.com/OSLL/aido-auto-feedback'
+                ),
+                Repository(
+                    'MD-Code_generator',
+                    'https://github.com/OSLL/MD-Code_generator'
+                ),
+                Repository(
+                    'code-plagiarism',
+                    'https://github.com/OSLL/code-plagiarism'
+                )
+            ],
+        ),
+        (
             {
-                'arguments': {
-                    'api_url': 'bad/link',
-                    'params': {}
-                },
-                'token': 'test_token',
-                'get_posargs': ['https://api.github.com/bad/link'],
-                'get_kwargs': {
-                    'headers': {
-                        'accept': 'application/vnd.github.v3+json',
-                        'Authorization': 'token test_token'
-                    },
-                    'params': {}
-                },
-                'response': Response(status_code=403),
-                'raised': KeyError
+                'owner': 'OSLL',
+                'reg_exp': r'\ba'
             },
+            [
+                call(
+                    '/users/OSLL/repos',
+                    params={
+                        'per_page': 100,
+                        'page': 1
+                    }
+                ),
+                call(
+                    '/users/OSLL/repos',
+                    params={
+                        'per_page': 100,
+                        'page': 2
+                    }
+                )
+            ],
+            [
+                make_response(
+                    [
+                        {
+                            'name': 'asm_web_debug',
+                            'html_url': 'https://github.com/OSLL/asm_web_debug'
+                        },
+                        {
+                            'name': 'aido-auto-feedback',
+                            'html_url': 'https://github.com/OSLL/aido-auto-feedback'
+                        }
+                    ],
+                    links=get_page_links(2)
+                ),
+                make_response(
+                    [
+                        {
+                            'name': 'MD-Code_generator',
+                            'html_url': 'https://github.com/OSLL/MD-Code_generator'
+                        },
+                        {
+                            'name': 'code-plagiarism',
+                            'html_url': 'https://github.com/OSLL/code-plagiarism'
+                        }
+                    ]
+                )
+            ],
+            [
+                Repository(
+                    'asm_web_debug',
+                    'https://github.com/OSLL/asm_web_debug'
+                ),
+                Repository(
+                    'aido-auto-feedback',
+                    'https://github.com/OSLL/aido-auto-feedback'
+                ),
+            ],
+        ),
+    ],
+    ids=['empty', 'all', 'regexp']
+)
+def test_get_list_of_repos(mocker: MockerFixture, parser, arguments, send_calls,
+                           send_rvs, expected_result):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_send_get_request.side_effect = side_effect_by_call(send_calls, send_rvs)
+
+    rv = list(parser.get_list_of_repos(**arguments))
+    assert rv == expected_result
+
+    assert_calls_in_any_order(mock_send_get_request, send_calls)
+
+
+def test_get_list_of_repos_last_page(mocker: MockerFixture, parser):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    repo = {
+        'name': 'code-plagiarism',
+        'html_url': 'https://github.com/OSLL/code-plagiarism'
+    }
+    mock_send_get_request.side_effect = lambda api_url, params: make_response(
+        [repo], links=get_page_links(5) if params['page'] == 1 else None
+    )
+
+    rv = list(parser.get_list_of_repos('OSLL'))
+    assert rv == [
+        Repository('code-plagiarism', 'https://github.com/OSLL/code-plagiarism')
+    ] * 5
+    assert_calls_in_any_order(
+        mock_send_get_request,
+        [
+            call('/users/OSLL/repos', params={'per_page': 100, 'page': page})
+            for page in range(1, 6)
         ]
+    )
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            if test_case.get('token'):
-                parser = GitHubParser(access_token=test_case['token'])
 
-            mock_get.reset_mock()
-            mock_get.return_value = test_case['response']
+@pytest.mark.parametrize(
+    "method, arguments, api_url, item",
+    [
+        (
+            'get_list_of_repos',
+            {'owner': 'OSLL'},
+            '/users/OSLL/repos',
+            {'name': 'code-plagiarism', 'html_url': 'https://github.com/OSLL/code-plagiarism'},
+        ),
+        (
+            'get_pulls_info',
+            {'owner': 'OSLL', 'repo': 'code-plagiarism'},
+            '/repos/OSLL/code-plagiarism/pulls',
+            {
+                'number': 1,
+                'head': {'sha': 'sha1', 'label': 'OSLL:iss1'},
+                'state': 'open',
+                'draft': False,
+            },
+        ),
+        (
+            'get_list_repo_branches',
+            {'owner': 'OSLL', 'repo': 'code-plagiarism'},
+            '/repos/OSLL/code-plagiarism/branches',
+            {'name': 'main', 'commit': {'sha': 'sha1'}},
+        ),
+    ],
+    ids=['repos', 'pulls', 'branches']
+)
+def test_paginated_lists_pages(mocker: MockerFixture, parser, method, arguments,
+                               api_url, item):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_send_get_request.side_effect = lambda api_url, params: make_response(
+        [item], links=get_page_links(5) if params['page'] == 1 else None
+    )
+
+    rv = list(getattr(parser, method)(**arguments))
+    assert len(rv) == 5
 
-            with self.subTest(test_case=test_case):
-                with self.assertRaises(test_case['raised']):
-                    parser.send_get_request(**test_case['arguments'])
+    # The biggest pages are requested up to the last one from the Link header
+    # without probing the page after it
+    assert github_parser._PAGE_SIZE == 100
+    assert_calls_in_any_order(
+        mock_send_get_request,
+        [
+            call(api_url, params={'per_page': 100, 'page': page})
+            for page in range(1, 6)
+        ]
+    )
 
-                mock_get.assert_called_once_with(*test_case['get_posargs'],
-                                                 **test_case['get_kwargs'])
 
-    @patch('webparsers.github_parser.GitHubParser.send_get_request')
-    def test_get_list_of_repos(self, mock_send_get_request):
-        test_cases = [
+@pytest.mark.parametrize(
+    "arguments, send_calls, send_rvs, expected_result",
+    [
+        (
             {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'reg_exp': None
-                },
-                'send_calls': [
-                    call(
-                        '/users/OSLL/repos',
-                        params={
-                            'per_page': 100,
-                            'page': 1
-                        }
-                    )
-                ],
-                'send_rvs': [Response(response_json=[])],
-                'expected_result': []
+                'owner': 'OSLL',
+                'repo': 'code-plagiarism'
             },
+            [
+                call(
+                    '/repos/OSLL/code-plagiarism/pulls',
+                    params={
+                        'per_page': 100,
+                        'page': 1
+                    }
+                )
+            ],
+            [get_empty_response()],
+            [],
+        ),
+        (
             {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'reg_exp': None
-                },
-                'send_calls': [
-                    call(
-                        '/users/OSLL/repos',
-                        params={
-                            'per_page': 100,
-                            'page': 1
-                        }
-                    ),
-                    call(
-                        '/users/OSLL/repos',
-                        params={
-                            'per_page': 100,
-                            'page': 2
+                'owner': 'OSLL',
+                'repo': 'code-plagiarism'
+            },
+            [
+                call(
+                    '/repos/OSLL/code-plagiarism/pulls',
+                    params={
+                        'per_page': 100,
+                        'page': 1
+                    }
+                ),
+                call(
+                    '/repos/OSLL/code-plagiarism/pulls',
+                    params={
+                        'per_page': 100,
+                        'page': 2
+                    }
+                )
+            ],
+            [
+                make_response(
+                    [
+                        {
+                            'commits_url': 'https://api.github.com/repos/OSLL/code-plagiarism/pulls/1/commits',
+                            'number': 1,
+                            'head': {
+                                'label': 'code-plagiarism:cp_130',
+                                'sha': 'jskfjsjskjfl'
+                            },
+                            'state': 'Open',
+                            'draft': False
+                        },
+                        {
+                            'commits_url': 'https://api.github.com/repos/OSLL/code-plagiarism/pulls/2/commits',
+                            'number': 2,
+                            'head': {
+                                'label': 'code-plagiarism:cp_110',
+                                'sha': 'jzxvjipwerknmzxvj'
+                            },
+                            'state': 'Open',
+                            'draft': True
                         }
-                    ),
-                    call(
-                        '/users/OSLL/repos',
-                        params={
-                            'per_page': 100,
-                            'page': 3
+                    ],
+                    links=get_page_links(2)
+                ),
+                make_response(
+                    [
+                        {
+                            'commits_url': 'https://api.github.com/repos/OSLL/code-plagiarism/pulls/3/commits',
+                            'number': 3,
+                            'head': {
+                                'label': 'code-plagiarism:bag_fix',
+                                'sha': 'jskfjsjskjfl'
+                            },
+                            'state': 'Open',
+                            'draft': False
+                        },
+                        {
+                            'commits_url': 'https://api.github.com/repos/OSLL/code-plagiarism/pulls/4/commits',
+                            'number': 4,
+                            'head': {
+                                'label': 'code-plagiarism:lite',
+                                'sha': 'jzxvjipwerknmzxvj'
+                            },
+                            'state': 'Open',
+                            'draft': True
                         }
-                    )
-                ],
-                'send_rvs': [
-                    Response(
-                        [
+                    ]
+                )
+            ],
+            [
+                PullRequest(
+                    number=1, last_commit_sha='jskfjsjskjfl', owner='code-plagiarism', branch='cp_130', state='Open', draft=False
+                ),
+                PullRequest(
+                    number=2, last_commit_sha='jzxvjipwerknmzxvj', owner='code-plagiarism', branch='cp_110', state='Open', draft=True
+                ),
+                PullRequest(
+                    number=3, last_commit_sha='jskfjsjskjfl', owner='code-plagiarism', branch='bag_fix', state='Open', draft=False
+                ),
+                PullRequest(
+                    number=4, last_commit_sha='jzxvjipwerknmzxvj', owner='code-plagiarism', branch='lite', state='Open', draft=True
+                )
+            ],
+        ),
+    ],
+    ids=['one-page', 'two-pages']
+)
+def test_get_pulls_info(mocker: MockerFixture, parser, arguments, send_calls, send_rvs,
+                        expected_result):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_send_get_request.side_effect = side_effect_by_call(send_calls, send_rvs)
+
+    rv = list(parser.get_pulls_info(**arguments))
+    assert rv == expected_result
+
+    assert_calls_in_any_order(mock_send_get_request, send_calls)
+
+
+@pytest.mark.parametrize(
+    "arguments, send_calls, send_rv, expected_result",
+    [
+        (
+            {
+                'owner': 'OSLL',
+                'repo': 'aido-auto-feedback'
+            },
+            [
+                call('/repos/OSLL/aido-auto-feedback')
+            ],
+            make_response({'default_branch': 'main'}),
+            'main',
+        ),
+        (
+            {
+                'owner': 'moevm',
+                'repo': 'asm_web_debug'
+            },
+            [
+                call('/repos/moevm/asm_web_debug')
+            ],
+            make_response({'default_branch': 'issue2'}),
+            'issue2',
+        ),
+    ]
+)
+def test_get_name_default_branch(mocker: MockerFixture, parser, arguments, send_calls,
+                                 send_rv, expected_result):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_send_get_request.return_value = send_rv
+
+    rv = parser.get_name_default_branch(**arguments)
+    assert rv == expected_result
+
+    assert_calls(mock_send_get_request, send_calls)
+
+
+@pytest.mark.parametrize(
+    "arguments, send_calls, send_rv, expected_result",
+    [
+        (
+            {
+                'owner': 'OSLL',
+                'repo': 'aido-auto-feedback',
+            },
+            [
+                call('/repos/OSLL/aido-auto-feedback/branches/main')
+            ],
+            make_response(
+                {
+                    'commit': {
+                        'sha': 'jal934304'
+                    }
+                }
+            ),
+            'jal934304',
+        ),
+        (
+            {
+                'owner': 'moevm',
+                'repo': 'asm_web_debug',
+                'branch': 'iss76'
+            },
+            [
+                call('/repos/moevm/asm_web_debug/branches/iss76')
+            ],
+            make_response(
+                {
+                    'commit': {
+                        'sha': 'xyuwr934hsd'
+                    }
+                }
+            ),
+            'xyuwr934hsd',
+        ),
+    ]
+)
+def test_get_sha_last_branch_commit(mocker: MockerFixture, parser, arguments,
+                                    send_calls, send_rv, expected_result):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_send_get_request.return_value = send_rv
+
+    rv = parser.get_sha_last_branch_commit(**arguments)
+    assert rv == expected_result
+
+    assert_calls(mock_send_get_request, send_calls)
+
+
+@pytest.mark.parametrize(
+    "arguments, get_url, chunks, expected_result",
+    [
+        (
+            {
+                'owner': 'OSLL',
+                'repo': 'aido-auto-feedback',
+                'sha': 'kljsdfkiwe0341',
+                'file_path': 'http://api.github.com/repos'
+            },
+            'https://api.github.com/repos/OSLL/aido-auto-feedback/git/blobs/kljsdfkiwe0341',
+            [b'Good ', b'message'],
+            ('Good message', 'http://api.github.com/repos'),
+        ),
+        (
+            {
+                'owner': 'moevm',
+                'repo': 'asm_web_debug',
+                'sha': 'jsadlkf3904',
+                'file_path': 'http://api.github.com/test'
+            },
+            'https://api.github.com/repos/moevm/asm_web_debug/git/blobs/jsadlkf3904',
+            [b'Bad\xee\xeemessage'],
+            ('Badmessage', 'http://api.github.com/test'),
+        ),
+        (
+            {
+                'owner': 'moevm',
+                'repo': 'asm_web_debug',
+                'sha': 'lkjsdfiwe43',
+                'file_path': 'http://api.github.com/utf8'
+            },
+            'https://api.github.com/repos/moevm/asm_web_debug/git/blobs/lkjsdfiwe43',
+            # The chunks are split inside of the two bytes character
+            [b'print("\xd0', b'\x9f")'],
+            ('print("\u041f")', 'http://api.github.com/utf8'),
+        ),
+        (
+            {
+                'owner': 'moevm',
+                'repo': 'asm_web_debug',
+                'sha': 'kjsdfluw34',
+                'file_path': 'http://api.github.com/big'
+            },
+            'https://api.github.com/repos/moevm/asm_web_debug/git/blobs/kjsdfluw34',
+            [b'a = 1\n' * 2 ** 14] * 2 ** 4,
+            ('a = 1\n' * 2 ** 18, 'http://api.github.com/big'),
+        ),
+    ]
+)
+def test_get_file_content_from_sha(mocker: MockerFixture, parser, arguments, get_url,
+                                   chunks, expected_result):
+    mock_get = mocker.patch.object(requests.Session, 'get')
+    response = make_response()
+    response.iter_content.return_value = chunks
+    # The raw blob must be read only by the chunks
+    del response.content
+    del response.text
+    mock_get.return_value = response
+
+    rv = parser.get_file_content_from_sha(**arguments)
+    assert rv == expected_result
+
+    mock_get.assert_called_once_with(
+        get_url,
+        headers={'accept': 'application/vnd.github.v3.raw'},
+        stream=True
+    )
+
+
+@pytest.mark.parametrize(
+    "arguments, send_calls, send_se, get_file_content_calls, get_file_content_se, expected_result",
+    [
+        (
+            {
+                'owner': 'OSLL',
+                'repo': 'aido-auto-feedback',
+                'branch': 'iss76',
+                'sha': 'kljsdfkiwe0341',
+            },
+            [
+                call(
+                    '/repos/OSLL/aido-auto-feedback/git/trees/kljsdfkiwe0341',
+                    params={'recursive': 1}
+                )
+            ],
+            [
+                make_response(
+                    {
+                        'tree': [
                             {
-                                'name': 'asm_web_debug',
-                                'html_url': 'https://github.com/OSLL/asm_web_debug'
+                                'type': 'tree',
+                                'path': 'src',
+                                'sha': 'jslkfjjeuwijsdmvd'
                             },
                             {
-                                'name': 'aido-auto-feedback',
-                                'html_url': 'https://github.com/OSLL/aido-auto-feedback'
-                            }
-                        ]
-                    ),
-                    Response(
-                        [
+                                'type': 'blob',
+                                'path': 'src/utils.py',
+                                'sha': 'uwrcbasrew94'
+                            },
                             {
-                                'name': 'MD-Code_generator',
-                                'html_url': 'https://github.com/OSLL/MD-Code_generator'
+                                'type': 'blob',
+                                'path': 'src/tests.py',
+                                'sha': 'vbuqcvxpiwe'
                             },
                             {
-                                'name': 'code-plagiarism',
-                                'html_url': 'https://github.com/OSLL/code-plagiarism'
+                                'type': 'blob',
+                                'path': 'main.py',
+                                'sha': 'ixiuerjs9430',
                             }
-                        ]
-                    ),
-                    Response([])
-                ],
-                'expected_result': [
-                    Repository(
-                        'asm_web_debug',
-                        'https://github.com/OSLL/asm_web_debug'
-                    ),
-                    Repository(
-                        'aido-auto-feedback',
-                        'https://github.com/OSLL/aido-auto-feedback'
-                    ),
-                    Repository(
-                        'MD-Code_generator',
-                        'https://github.com/OSLL/MD-Code_generator'
-                    ),
-                    Repository(
-                        'code-plagiarism',
-                        'https://github.com/OSLL/code-plagiarism'
-                    )
-                ]
-            },
+                        ],
+                        'truncated': False
+                    }
+                )
+            ],
+            [
+                call(
+                    'OSLL',
+                    'aido-auto-feedback',
+                    'uwrcbasrew94',
+                    'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'
+                ),
+                call(
+                    'OSLL',
+                    'aido-auto-feedback',
+                    'vbuqcvxpiwe',
+                    'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'
+                ),
+                call(
+                    'OSLL',
+                    'aido-auto-feedback',
+                    'ixiuerjs9430',
+                    'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'
+                ),
+            ],
+            [
+                ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
+                ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
+                ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+            ],
+            [
+                ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
+                ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
+                ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+            ],
+        ),
+        (
             {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'reg_exp': r'\ba'
-                },
-                'send_calls': [
-                    call(
-                        '/users/OSLL/repos',
-                        params={
-                            'per_page': 100,
-                            'page': 1
-                        }
-                    ),
-                    call(
-                        '/users/OSLL/repos',
-                        params={
-                            'per_page': 100,
-                            'page': 2
-                        }
-                    ),
-                    call(
-                        '/users/OSLL/repos',
-                        params={
-                            'per_page': 100,
-                            'page': 3
-                        }
-                    )
-                ],
-                'send_rvs': [
-                    Response(
-                        [
+                'owner': 'OSLL',
+                'repo': 'aido-auto-feedback',
+                'branch': 'iss76',
+                'sha': 'kljsdfkiwe0341',
+                'path_regexp': re.compile("s[.]py")
+            },
+            [
+                call(
+                    '/repos/OSLL/aido-auto-feedback/git/trees/kljsdfkiwe0341',
+                    params={'recursive': 1}
+                )
+            ],
+            [
+                make_response(
+                    {
+                        'tree': [
                             {
-                                'name': 'asm_web_debug',
-                                'html_url': 'https://github.com/OSLL/asm_web_debug'
+                                'type': 'tree',
+                                'path': 'src',
+                                'sha': 'jslkfjjeuwijsdmvd'
                             },
                             {
-                                'name': 'aido-auto-feedback',
-                                'html_url': 'https://github.com/OSLL/aido-auto-feedback'
-                            }
-                        ]
-                    ),
-                    Response(
-                        [
+                                'type': 'blob',
+                                'path': 'src/utils.py',
+                                'sha': 'uwrcbasrew94'
+                            },
                             {
-                                'name': 'MD-Code_generator',
-                                'html_url': 'https://github.com/OSLL/MD-Code_generator'
+                                'type': 'blob',
+                                'path': 'src/tests.py',
+                                'sha': 'vbuqcvxpiwe'
                             },
                             {
-                                'name': 'code-plagiarism',
-                                'html_url': 'https://github.com/OSLL/code-plagiarism'
+                                'type': 'blob',
+                                'path': 'main.py',
+                                'sha': 'ixiuerjs9430',
                             }
-                        ]
-                    ),
-                    Response([])
-                ],
-                'expected_result': [
-                    Repository(
-                        'asm_web_debug',
-                        'https://github.com/OSLL/asm_web_debug'
-                    ),
-                    Repository(
-                        'aido-auto-feedback',
-                        'https://github.com/OSLL/aido-auto-feedback'
-                    ),
-                ]
-            }
-        ]
-
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_send_get_request.reset_mock()
-            mock_send_get_request.side_effect = test_case['send_rvs']
-
-            with self.subTest(test_case=test_case):
-                rv = parser.get_list_of_repos(**test_case['arguments'])
-                self.assertEqual(rv, test_case['expected_result'])
-
-                self.assertEqual(
-                    mock_send_get_request.mock_calls,
-                    test_case['send_calls']
+                        ],
+                        'truncated': False
+                    }
                 )
-
-    @patch('webparsers.github_parser.GitHubParser.send_get_request')
-    def test_get_pulls_info(self, mock_send_get_request):
-        test_cases = [
+            ],
+            [
+                call(
+                    'OSLL',
+                    'aido-auto-feedback',
+                    'uwrcbasrew94',
+                    'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'
+                ),
+                call(
+                    'OSLL',
+                    'aido-auto-feedback',
+                    'vbuqcvxpiwe',
+                    'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'
+                ),
+            ],
+            [
+                ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
+                ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
+            ],
+            [
+                ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
+                ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
+            ],
+        ),
+        (
             {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'repo': 'code-plagiarism'
-                },
-                'send_calls': [
-                    call(
-                        '/repos/OSLL/code-plagiarism/pulls',
-                        params={
-                            'per_page': 100,
-                            'page': 1
-                        }
-                    )
-                ],
-                'send_rvs': [Response([])],
-                'expected_result': []
+                'owner': 'OSLL',
+                'repo': 'aido-auto-feedback',
+                'branch': 'iss76',
+                'sha': 'kljsdfkiwe0341',
             },
-            {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'repo': 'code-plagiarism'
-                },
-                'send_calls': [
-                    call(
-                        '/repos/OSLL/code-plagiarism/pulls',
-                        params={
-                            'per_page': 100,
-                            'page': 1
-                        }
-                    ),
-                    call(
-                        'https://api.github.com/repos/OSLL/code-plagiarism/pulls/1/commits',
-                        address=''
-                    ),
-                    call(
-                        'https://api.github.com/repos/OSLL/code-plagiarism/pulls/2/commits',
-                        address=''
-                    ),
-                    call(
-                        '/repos/OSLL/code-plagiarism/pulls',
-                        params={
-                            'per_page': 100,
-                            'page': 2
-                        }
-                    ),
-                    call(
-                        'https://api.github.com/repos/OSLL/code-plagiarism/pulls/3/commits',
-                        address=''
-                    ),
-                    call(
-                        'https://api.github.com/repos/OSLL/code-plagiarism/pulls/4/commits',
-                        address=''
-                    ),
-                    call(
-                        '/repos/OSLL/code-plagiarism/pulls',
-                        params={
-                            'per_page': 100,
-                            'page': 3
-                        }
-                    ),
-                ],
-                'send_rvs': [
-                    Response(
-                        [
+            [
+                call(
+                    '/repos/OSLL/aido-auto-feedback/git/trees/kljsdfkiwe0341',
+                    params={'recursive': 1}
+                ),
+                call(
+                    '/repos/OSLL/aido-auto-feedback/git/trees/kljsdfkiwe0341'
+                ),
+                call(
+                    '/repos/OSLL/aido-auto-feedback/git/trees/jslkfjjeuwijsdmvd'
+                )
+            ],
+            [
+                make_response({'tree': [], 'truncated': True}),
+                make_response(
+                    {
+                        'tree': [
                             {
-                                'commits_url': 'https://api.github.com/repos/OSLL/code-plagiarism/pulls/1/commits',
-                                'number': 1,
-                                'head': {
-                                    'label': 'code-plagiarism:cp_130'
-                                },
-                                'state': 'Open',
-                                'draft': False
+                                'type': 'tree',
+                                'path': 'src',
+                                'sha': 'jslkfjjeuwijsdmvd'
                             },
                             {
-                                'commits_url': 'https://api.github.com/repos/OSLL/code-plagiarism/pulls/2/commits',
-                                'number': 2,
-                                'head': {
-                                    'label': 'code-plagiarism:cp_110'
-                                },
-                                'state': 'Open',
-                                'draft': True
+                                'type': 'blob',
+                                'path': 'main.py',
+                                'sha': 'ixiuerjs9430',
                             }
-                        ]
-                    ),
-                    Response([{'sha': 'jskfjsjskjfl'}]),
-                    Response([{'sha': 'jzxvjipwerknmzxvj'}]),
-                    Response(
-                        [
+                        ],
+                    }
+                ),
+                make_response(
+                    {
+                        'tree': [
                             {
-                                'commits_url': 'https://api.github.com/repos/OSLL/code-plagiarism/pulls/3/commits',
-                                'number': 3,
-                                'head': {
-                                    'label': 'code-plagiarism:bag_fix'
-                                },
-                                'state': 'Open',
-                                'draft': False
+                                'type': 'blob',
+                                'path': 'utils.py',
+                                'sha': 'uwrcbasrew94'
                             },
                             {
-                                'commits_url': 'https://api.github.com/repos/OSLL/code-plagiarism/pulls/4/commits',
-                                'number': 4,
-                                'head': {
-                                    'label': 'code-plagiarism:lite'
-                                },
-                                'state': 'Open',
-                                'draft': True
+                                'type': 'blob',
+                                'path': 'tests.py',
+                                'sha': 'vbuqcvxpiwe'
                             }
                         ]
-                    ),
-                    Response([{'sha': 'jskfjsjskjfl'}]),
-                    Response([{'sha': 'jzxvjipwerknmzxvj'}]),
-                    Response([])
-                ],
-                'expected_result': [
-                    PullRequest(
-                        number=1, last_commit_sha='jskfjsjskjfl', owner='code-plagiarism', branch='cp_130', state='Open', draft=False
-                    ),
-                    PullRequest(
-                        number=2, last_commit_sha='jzxvjipwerknmzxvj', owner='code-plagiarism', branch='cp_110', state='Open', draft=True
-                    ),
-                    PullRequest(
-                        number=3, last_commit_sha='jskfjsjskjfl', owner='code-plagiarism', branch='bag_fix', state='Open', draft=False
-                    ),
-                    PullRequest(
-                        number=4, last_commit_sha='jzxvjipwerknmzxvj', owner='code-plagiarism', branch='lite', state='Open', draft=True
-                    )
-                ]
-            }
+                    }
+                )
+            ],
+            [
+                call(
+                    'OSLL',
+                    'aido-auto-feedback',
+                    'uwrcbasrew94',
+                    'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'
+                ),
+                call(
+                    'OSLL',
+                    'aido-auto-feedback',
+                    'vbuqcvxpiwe',
+                    'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'
+                ),
+                call(
+                    'OSLL',
+                    'aido-auto-feedback',
+                    'ixiuerjs9430',
+                    'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'
+                ),
+            ],
+            [
+                ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
+                ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
+                ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+            ],
+            [
+                ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
+                ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
+                ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+            ],
+        ),
+    ],
+    ids=['recursive', 'path-regexp', 'truncated']
+)
+def test_get_files_generator_from_sha_commit(mocker: MockerFixture, parser, arguments,
+                                             send_calls, send_se,
+                                             get_file_content_calls,
+                                             get_file_content_se, expected_result):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    mock_send_get_request.side_effect = send_se
+    # The blobs are requested concurrently, so the order of the calls varies
+    mock_get_file_content_from_sha.side_effect = side_effect_by_call(
+        get_file_content_calls, get_file_content_se
+    )
+
+    rv = list(parser.get_files_generator_from_sha_commit(**arguments))
+    assert rv == expected_result
+
+    assert_calls(mock_send_get_request, send_calls)
+    assert_calls_in_any_order(
+        mock_get_file_content_from_sha, get_file_content_calls
+    )
+
+
+def test_get_files_generator_from_sha_commit_order(mocker: MockerFixture, parser):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    paths = [f'src/module{i}.py' for i in range(50)]
+    mock_send_get_request.return_value = make_response(
+        {
+            'tree': [
+                {'type': 'blob', 'path': path, 'sha': f'sha{i}'}
+                for i, path in enumerate(paths)
+            ],
+            'truncated': False
+        }
+    )
+    mock_get_file_content_from_sha.side_effect = (
+        lambda owner, repo, sha, link: (sha, link)
+    )
+
+    rv = list(
+        parser.get_files_generator_from_sha_commit(
+            'OSLL', 'aido-auto-feedback', 'iss76', 'kljsdfkiwe0341'
+        )
+    )
+    assert rv == [
+        (f'sha{i}', f'https://github.com/OSLL/aido-auto-feedback/blob/iss76/{path}')
+        for i, path in enumerate(paths)
+    ]
+
+
+def test_get_files_generator_from_sha_commit_copies(mocker: MockerFixture, parser):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    mock_send_get_request.return_value = make_response(
+        {
+            'tree': [
+                {'type': 'blob', 'path': 'main.py', 'sha': 'sha1'},
+                {'type': 'blob', 'path': 'utils.py', 'sha': 'sha2'},
+                {'type': 'blob', 'path': 'copy/main.py', 'sha': 'sha1'},
+            ],
+            'truncated': False
+        }
+    )
+    mock_get_file_content_from_sha.side_effect = (
+        lambda owner, repo, sha, link: WorkInfo(f'code of {sha}', link)
+    )
+
+    rv = list(
+        parser.get_files_generator_from_sha_commit(
+            'OSLL', 'aido-auto-feedback', 'iss76', 'kljsdfkiwe0341'
+        )
+    )
+    assert rv == [
+        WorkInfo('code of sha1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+        WorkInfo('code of sha2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/utils.py'),
+        WorkInfo('code of sha1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/copy/main.py'),
+    ]
+    assert_calls_in_any_order(
+        mock_get_file_content_from_sha,
+        [
+            call('OSLL', 'aido-auto-feedback', 'sha1',
+                 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+            call('OSLL', 'aido-auto-feedback', 'sha2',
+                 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/utils.py'),
         ]
+    )
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_send_get_request.reset_mock()
-            mock_send_get_request.side_effect = test_case['send_rvs']
-            with self.subTest(test_case=test_case):
-                rv = parser.get_pulls_info(**test_case['arguments'])
-                self.assertEqual(rv, test_case['expected_result'])
-
-                assert len(
-                    mock_send_get_request.mock_calls
-                ) == len(test_case['send_calls'])
-                for actual_call, expected_call in zip(
-                    mock_send_get_request.mock_calls,
-                    test_case['send_calls']
-                ):
-                    assert actual_call == expected_call
-
-    @patch('webparsers.github_parser.GitHubParser.send_get_request')
-    def test_get_name_default_branch(self, mock_send_get_request):
-        test_cases = [
-            {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'repo': 'aido-auto-feedback'
-                },
-                'send_calls': [
-                    call('/repos/OSLL/aido-auto-feedback')
-                ],
-                'send_rv': Response({'default_branch': 'main'}),
-                'expected_result': 'main'
-            },
-            {
-                'arguments': {
-                    'owner': 'moevm',
-                    'repo': 'asm_web_debug'
+
+def test_get_files_generator_from_sha_commit_streaming(mocker: MockerFixture, parser):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    mock_send_get_request.return_value = make_response(
+        {
+            'tree': [
+                {'type': 'blob', 'path': f'module{i}.py', 'sha': f'sha{i}'}
+                for i in range(50)
+            ],
+            'truncated': False
+        }
+    )
+    first_consumed = threading.Event()
+
+    def get_file_content_from_sha(owner, repo, sha, link):
+        # The rest of the files are downloaded until the first one is consumed
+        if sha != 'sha0':
+            assert first_consumed.wait(timeout=5)
+
+        return sha
+
+    mock_get_file_content_from_sha.side_effect = get_file_content_from_sha
+
+    gen = parser.get_files_generator_from_sha_commit(
+        'OSLL', 'aido-auto-feedback', 'iss76', 'kljsdfkiwe0341'
+    )
+    assert next(gen) == 'sha0'
+    assert 1 <= mock_get_file_content_from_sha.call_count <= github_parser._BLOBS_WINDOW
+
+    first_consumed.set()
+    assert list(gen) == [f'sha{i}' for i in range(1, 50)]
+    assert mock_get_file_content_from_sha.call_count == 50
+
+
+@pytest.mark.parametrize("path_regexp", ["s[.]py", re.compile("s[.]py")])
+def test_get_files_generator_from_sha_commit_path_regexp(mocker: MockerFixture, parser,
+                                                         path_regexp):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    mock_send_get_request.return_value = make_response(
+        {
+            'tree': [
+                {
+                    'type': 'blob',
+                    'path': 'src/utils.py',
+                    'sha': 'uwrcbasrew94'
                 },
-                'send_calls': [
-                    call('/repos/moevm/asm_web_debug')
-                ],
-                'send_rv': Response({'default_branch': 'issue2'}),
-                'expected_result': 'issue2'
-            },
-        ]
+                {
+                    'type': 'blob',
+                    'path': 'main.py',
+                    'sha': 'ixiuerjs9430',
+                }
+            ],
+            'truncated': False
+        }
+    )
+    mock_get_file_content_from_sha.side_effect = (
+        lambda owner, repo, sha, link: ('Some code', link)
+    )
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_send_get_request.reset_mock()
-            mock_send_get_request.return_value = test_case['send_rv']
+    rv = list(
+        parser.get_files_generator_from_sha_commit(
+            'OSLL', 'aido-auto-feedback', 'iss76', 'kljsdfkiwe0341',
+            path_regexp=path_regexp
+        )
+    )
+    assert rv == [
+        ('Some code', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
+    ]
 
-            with self.subTest(test_case=test_case):
-                rv = parser.get_name_default_branch(**test_case['arguments'])
-                self.assertEqual(rv, test_case['expected_result'])
 
-                self.assertEqual(
-                    mock_send_get_request.mock_calls,
-                    test_case['send_calls']
+@pytest.mark.parametrize(
+    "arguments, send_calls, send_se, expected_result",
+    [
+        (
+            {
+                'owner': 'OSLL',
+                'repo': 'aido-auto-feedback'
+            },
+            [
+                call(
+                    '/repos/OSLL/aido-auto-feedback/branches',
+                    params={
+                        'per_page': 100,
+                        'page': 1
+                    }
                 )
-
-    @patch('webparsers.github_parser.GitHubParser.send_get_request')
-    def test_get_sha_last_branch_commit(self, mock_send_get_request):
-        test_cases = [
+            ],
+            [
+                make_response(
+                    [
+                        {
+                            'name': 'main',
+                            'commit': {
+                                'sha': '0928jlskdfj'
+                            }
+                        },
+                        {
+                            'name': 'iss76',
+                            'commit': {
+                                'sha': 'kjsadfwi'
+                            }
+                        },
+                    ]
+                )
+            ],
+            [
+                Branch('main', '0928jlskdfj'),
+                Branch('iss76', 'kjsadfwi')
+            ],
+        ),
+        (
             {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'repo': 'aido-auto-feedback',
-                },
-                'send_calls': [
-                    call('/repos/OSLL/aido-auto-feedback/branches/main')
-                ],
-                'send_rv': Response(
-                    {
-                        'commit': {
-                            'sha': 'jal934304'
-                        }
+                'owner': 'moevm',
+                'repo': 'asm_web_debug',
+            },
+            [
+                call(
+                    '/repos/moevm/asm_web_debug/branches',
+                    params={
+                        'per_page': 100,
+                        'page': 1
                     }
                 ),
-                'expected_result': 'jal934304'
-            },
-            {
-                'arguments': {
-                    'owner': 'moevm',
-                    'repo': 'asm_web_debug',
-                    'branch': 'iss76'
-                },
-                'send_calls': [
-                    call('/repos/moevm/asm_web_debug/branches/iss76')
-                ],
-                'send_rv': Response(
-                    {
-                        'commit': {
-                            'sha': 'xyuwr934hsd'
-                        }
+                call(
+                    '/repos/moevm/asm_web_debug/branches',
+                    params={
+                        'per_page': 100,
+                        'page': 2
                     }
+                )
+            ],
+            [
+                make_response(
+                    [
+                        {
+                            'name': 'main',
+                            'commit': {
+                                'sha': '0928jlskdfj'
+                            }
+                        },
+                    ],
+                    links=get_page_links(2)
                 ),
-                'expected_result': 'xyuwr934hsd'
-            },
-        ]
+                make_response(
+                    [
+                        {
+                            'name': 'iss76',
+                            'commit': {
+                                'sha': 'kjsadfwi'
+                            }
+                        },
+                    ]
+                )
+            ],
+            [
+                Branch('main', '0928jlskdfj'),
+                Branch('iss76', 'kjsadfwi')
+            ],
+        ),
+    ]
+)
+def test_get_list_repo_branches(mocker: MockerFixture, parser, arguments, send_calls,
+                                send_se, expected_result):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_send_get_request.side_effect = side_effect_by_call(send_calls, send_se)
+
+    rv = parser.get_list_repo_branches(**arguments)
+    assert rv == expected_result
+
+    assert_calls_in_any_order(mock_send_get_request, send_calls)
+
+
+def test_get_list_repo_branches_concurrently(mocker: MockerFixture, parser):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    # Each of the rest pages waits for the others, so the barrier is broken
+    # by its timeout if they are requested one by one
+    barrier = threading.Barrier(3, timeout=5)
+
+    def send_get_request(api_url, params):
+        if params['page'] == 1:
+            return make_response(
+                [{'name': 'main', 'commit': {'sha': 'sha1'}}],
+                links=get_page_links(4)
+            )
+
+        barrier.wait()
+        return make_response(
+            [{'name': f'iss{params["page"]}', 'commit': {'sha': f'sha{params["page"]}'}}]
+        )
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_send_get_request.reset_mock()
-            mock_send_get_request.return_value = test_case['send_rv']
+    mock_send_get_request.side_effect = send_get_request
 
-            with self.subTest(test_case=test_case):
-                rv = parser.get_sha_last_branch_commit(**test_case['arguments'])
-                self.assertEqual(rv, test_case['expected_result'])
+    rv = parser.get_list_repo_branches('OSLL', 'code-plagiarism')
+    assert rv == [
+        Branch('main', 'sha1'),
+        Branch('iss2', 'sha2'),
+        Branch('iss3', 'sha3'),
+        Branch('iss4', 'sha4'),
+    ]
+    assert mock_send_get_request.call_count == 4
 
-                self.assertEqual(mock_send_get_request.mock_calls, test_case['send_calls'])
 
-    @patch('webparsers.github_parser.GitHubParser.send_get_request')
-    def test_get_file_content_from_sha(self, mock_send_get_request):
-        test_cases = [
+@pytest.mark.parametrize(
+    "check_all, arguments, name_default_branch, branch_sha, branches, files, expected_result",
+    [
+        (
+            0,
             {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'repo': 'aido-auto-feedback',
-                    'sha': 'kljsdfkiwe0341',
-                    'file_path': 'http://api.github.com/repos'
-                },
-                'send_calls': [
-                    call('/repos/OSLL/aido-auto-feedback/git/blobs/kljsdfkiwe0341')
-                ],
-                'send_rv': Response(
-                    {
-                        'content': base64.b64encode(b'Good message')
-                    }
-                ),
-                'expected_result': ('Good message', 'http://api.github.com/repos')
+                'repo_url': 'https://github.com/OSLL/code-plagiarism',
             },
+            'iss76',
+            'uixbwupreiljlsdf',
+            None,
+            [('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py')],
+            [
+                ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+            ],
+        ),
+        (
+            1,
             {
-                'arguments': {
-                    'owner': 'moevm',
-                    'repo': 'asm_web_debug',
-                    'sha': 'jsadlkf3904',
-                    'file_path': 'http://api.github.com/test'
-                },
-                'send_calls': [
-                    call('/repos/moevm/asm_web_debug/git/blobs/jsadlkf3904')
-                ],
-                'send_rv': Response(
-                    {
-                        'content': base64.b64encode(b'Bad\xee\xeemessage')
-                    }
-                ),
-                'expected_result': ('Badmessage', 'http://api.github.com/test')
+                'repo_url': 'https://github.com/OSLL/code-plagiarism',
             },
-        ]
+            None,
+            None,
+            [
+                Branch('master', 'iobiqirsad'),
+                Branch('iss76', 'iobxzewqrsf')
+            ],
+            [('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py')],
+            [
+                ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+                ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py')
+            ],
+        ),
+    ]
+)
+def test_get_files_generator_from_repo_url(mocker: MockerFixture, parser,
+                                           check_all_parser, check_all, arguments,
+                                           name_default_branch, branch_sha, branches,
+                                           files, expected_result):
+    mock_get_files_generator_from_sha_commit = mocker.patch.object(
+        GitHubParser, 'get_files_generator_from_sha_commit'
+    )
+    mock_get_sha_last_branch_commit = mocker.patch.object(
+        GitHubParser, 'get_sha_last_branch_commit'
+    )
+    mock_get_list_repo_branches = mocker.patch.object(
+        GitHubParser, 'get_list_repo_branches'
+    )
+    mock_get_name_default_branch = mocker.patch.object(
+        GitHubParser, 'get_name_default_branch'
+    )
+    parser = check_all_parser if check_all else parser
+    mock_get_name_default_branch.return_value = name_default_branch
+    mock_get_sha_last_branch_commit.return_value = branch_sha
+    mock_get_files_generator_from_sha_commit.return_value = files
+    mock_get_list_repo_branches.return_value = branches
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_send_get_request.reset_mock()
-            mock_send_get_request.return_value = test_case['send_rv']
+    rv = list(parser.get_files_generator_from_repo_url(**arguments))
+    assert rv == expected_result
 
-            buf = io.StringIO()
-            with redirect_stdout(buf), self.subTest(test_case=test_case):
-                rv = parser.get_file_content_from_sha(**test_case['arguments'])
-                self.assertEqual(rv, test_case['expected_result'])
 
-                self.assertEqual(mock_send_get_request.mock_calls, test_case['send_calls'])
-
-    @patch('webparsers.github_parser.GitHubParser.get_file_content_from_sha')
-    @patch('webparsers.github_parser.GitHubParser.send_get_request')
-    def test_get_files_generator_from_sha_commit(self, mock_send_get_request,
-                                                 mock_get_file_content_from_sha):
-        test_cases = [
+@pytest.mark.parametrize(
+    "arguments, send_rv, get_file_content_rv, expected_result",
+    [
+        (
             {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'repo': 'aido-auto-feedback',
-                    'branch': 'iss76',
-                    'sha': 'kljsdfkiwe0341',
-                },
-                'send_calls': [
-                    call(
-                        '/repos/OSLL/aido-auto-feedback/git/trees/kljsdfkiwe0341'
-                    ),
-                    call(
-                        '/repos/OSLL/aido-auto-feedback/git/trees/jslkfjjeuwijsdmvd'
-                    )
-                ],
-                'send_se': [
-                    Response(
-                        {
-                            'tree': [
-                                {
-                                    'type': 'tree',
-                                    'path': 'src',
-                                    'sha': 'jslkfjjeuwijsdmvd'
-                                },
-                                {
-                                    'type': 'blob',
-                                    'path': 'main.py',
-                                    'sha': 'ixiuerjs9430',
-                                }
-                            ],
-                        }
-                    ),
-                    Response(
-                        {
-                            'tree': [
-                                {
-                                    'type': 'blob',
-                                    'path': 'utils.py',
-                                    'sha': 'uwrcbasrew94'
-                                },
-                                {
-                                    'type': 'blob',
-                                    'path': 'tests.py',
-                                    'sha': 'vbuqcvxpiwe'
-                                }
-                            ]
-                        }
-                    )
-                ],
-                'get_file_content_calls': [
-                    call(
-                        'OSLL',
-                        'aido-auto-feedback',
-                        'uwrcbasrew94',
-                        'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'
-                    ),
-                    call(
-                        'OSLL',
-                        'aido-auto-feedback',
-                        'vbuqcvxpiwe',
-                        'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'
-                    ),
-                    call(
-                        'OSLL',
-                        'aido-auto-feedback',
-                        'ixiuerjs9430',
-                        'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'
-                    ),
-                ],
-                'get_file_content_se': [
-                    ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
-                    ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
-                    ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
-                ],
-                'expected_result': [
-                    ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
-                    ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
-                    ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
-                ]
+                'file_url': 'https://github.com/OSLL/code-plagiarism/blob/main/src/codeplag/astfeatures.py'
             },
-            {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'repo': 'aido-auto-feedback',
-                    'branch': 'iss76',
-                    'sha': 'kljsdfkiwe0341',
-                    'path_regexp': re.compile("s[.]py")
-                },
-                'send_calls': [
-                    call(
-                        '/repos/OSLL/aido-auto-feedback/git/trees/kljsdfkiwe0341'
-                    ),
-                    call(
-                        '/repos/OSLL/aido-auto-feedback/git/trees/jslkfjjeuwijsdmvd'
-                    )
-                ],
-                'send_se': [
-                    Response(
-                        {
-                            'tree': [
-                                {
-                                    'type': 'tree',
-                                    'path': 'src',
-                                    'sha': 'jslkfjjeuwijsdmvd'
-                                },
-                                {
-                                    'type': 'blob',
-                                    'path': 'main.py',
-                                    'sha': 'ixiuerjs9430',
-                                }
-                            ],
-                        }
-                    ),
-                    Response(
-                        {
-                            'tree': [
-                                {
-                                    'type': 'blob',
-                                    'path': 'utils.py',
-                                    'sha': 'uwrcbasrew94'
-                                },
-                                {
-                                    'type': 'blob',
-                                    'path': 'tests.py',
-                                    'sha': 'vbuqcvxpiwe'
-                                }
-                            ]
-                        }
-                    )
-                ],
-                'get_file_content_calls': [
-                    call(
-                        'OSLL',
-                        'aido-auto-feedback',
-                        'uwrcbasrew94',
-                        'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'
-                    ),
-                    call(
-                        'OSLL',
-                        'aido-auto-feedback',
-                        'vbuqcvxpiwe',
-                        'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'
-                    ),
-                ],
-                'get_file_content_se': [
-                    ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
-                    ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
-                ],
-                'expected_result': [
-                    ('Some code 2', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/utils.py'),
-                    ('Some code 3', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/src/tests.py'),
-                ]
-            },
-        ]
+            make_response({'sha': 'ioujxbwurqer'}),
+            ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+            ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+        ),
+    ]
+)
+def test_get_file_from_url(mocker: MockerFixture, parser, arguments, send_rv,
+                           get_file_content_rv, expected_result):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    mock_send_get_request.return_value = send_rv
+    mock_get_file_content_from_sha.return_value = get_file_content_rv
+
+    rv = parser.get_file_from_url(**arguments)
+    assert rv == expected_result
+
+
+def test_regexps_compiled_once(mocker: MockerFixture, parser):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mocker.patch.object(GitHubParser, 'get_file_content_from_sha')
+    spy_compile = mocker.spy(re, 'compile')
+    mock_send_get_request.side_effect = lambda api_url, params: make_response(
+        {'tree': [{'type': 'blob', 'path': 'main.py', 'sha': 'sha1'}], 'truncated': False}
+        if 'trees' in api_url else
+        [{'name': 'code-plagiarism', 'html_url': 'https://github.com/OSLL/code-plagiarism'}]
+    )
+    github_parser._compile.cache_clear()
+
+    for _ in range(3):
+        list(
+            parser.get_files_generator_from_sha_commit(
+                'OSLL', 'code-plagiarism', 'main', 'sha', path_regexp='s[.]py'
+            )
+        )
+        list(parser.get_list_of_repos('OSLL', reg_exp='code'))
+
+    github_parser._compile.cache_clear()
+    assert spy_compile.mock_calls == [call('s[.]py'), call('code')]
+
+
+def test_send_graphql_request(mocker: MockerFixture, token_parser):
+    mock_post = mocker.patch.object(requests.Session, 'post')
+    mock_post.return_value = make_response({'data': {}})
+
+    rv = token_parser.send_graphql_request('query { viewer { login } }')
+
+    assert rv == {'data': {}}
+    mock_post.assert_called_once_with(
+        'https://api.github.com/graphql',
+        json={'query': 'query { viewer { login } }'}
+    )
+
+
+FILE_URLS = [
+    'https://github.com/OSLL/code-plagiarism/blob/main/setup.py',
+    'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py',
+    'https://github.com/OSLL/code-plagiarism/blob/main/src/big.py',
+]
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_send_get_request.reset_mock()
-            mock_send_get_request.side_effect = test_case['send_se']
-            mock_get_file_content_from_sha.reset_mock()
-            mock_get_file_content_from_sha.side_effect = test_case['get_file_content_se']
 
-            with self.subTest(test_case=test_case):
-                rv = list(parser.get_files_generator_from_sha_commit(**test_case['arguments']))
-                self.assertEqual(rv, test_case['expected_result'])
+def make_blob(text: Optional[str], oid: str = 'abc',
+              is_truncated: bool = False, is_binary: bool = False) -> dict:
+    return {
+        'oid': oid,
+        'text': text,
+        'isTruncated': is_truncated,
+        'isBinary': is_binary,
+    }
 
-                self.assertEqual(mock_send_get_request.mock_calls, test_case['send_calls'])
-                self.assertEqual(mock_get_file_content_from_sha.mock_calls, test_case['get_file_content_calls'])
 
-    @patch('webparsers.github_parser.GitHubParser.send_get_request')
-    def test_get_list_repo_branches(self, mock_send_get_request):
-        test_cases = [
+@pytest.mark.parametrize(
+    "token, send_rv, get_file_rvs, get_file_calls, expected_result",
+    [
+        (
+            '',
+            {},
+            [
+                ('Some code 1', FILE_URLS[0]),
+                ('Some code 2', FILE_URLS[1]),
+                ('Some code 3', FILE_URLS[2]),
+            ],
+            [call(file_url) for file_url in FILE_URLS],
+            [
+                ('Some code 1', FILE_URLS[0]),
+                ('Some code 2', FILE_URLS[1]),
+                ('Some code 3', FILE_URLS[2]),
+            ],
+        ),
+        (
+            'test_token',
             {
-                'arguments': {
-                    'owner': 'OSLL',
-                    'repo': 'aido-auto-feedback'
-                },
-                'send_calls': [
-                    call(
-                        '/repos/OSLL/aido-auto-feedback/branches',
-                        params={
-                            'per_page': 100,
-                            'page': 1
-                        }
-                    ),
-                    call(
-                        '/repos/OSLL/aido-auto-feedback/branches',
-                        params={
-                            'per_page': 100,
-                            'page': 2
-                        }
-                    ),
-                ],
-                'send_se': [
-                    Response(
-                        [
-                            {
-                                'name': 'main',
-                                'commit': {
-                                    'sha': '0928jlskdfj'
-                                }
-                            },
-                            {
-                                'name': 'iss76',
-                                'commit': {
-                                    'sha': 'kjsadfwi'
-                                }
-                            },
-                        ]
-                    ),
-                    Response([])
-                ],
-                'expected_result': [
-                    Branch('main', '0928jlskdfj'),
-                    Branch('iss76', 'kjsadfwi')
-                ]
+                'data': {
+                    'r0': {
+                        'f0': make_blob('Some code 1'),
+                        'f2': None
+                    },
+                    'r1': {'f1': make_blob('Some code 2')}
+                }
             },
-            {
-                'arguments': {
-                    'owner': 'moevm',
-                    'repo': 'asm_web_debug',
-                },
-                'send_calls': [
-                    call(
-                        '/repos/moevm/asm_web_debug/branches',
-                        params={
-                            'per_page': 100,
-                            'page': 1
-                        }
-                    ),
-                    call(
-                        '/repos/moevm/asm_web_debug/branches',
-                        params={
-                            'per_page': 100,
-                            'page': 2
-                        }
-                    ),
-                    call(
-                        '/repos/moevm/asm_web_debug/branches',
-                        params={
-                            'per_page': 100,
-                            'page': 3
-                        }
-                    ),
-                ],
-                'send_se': [
-                    Response(
-                        [
-                            {
-                                'name': 'main',
-                                'commit': {
-                                    'sha': '0928jlskdfj'
-                                }
-                            },
-                        ]
-                    ),
-                    Response(
-                        [
-                            {
-                                'name': 'iss76',
-                                'commit': {
-                                    'sha': 'kjsadfwi'
-                                }
-                            },
-                        ]
-                    ),
-                    Response([])
-                ],
-                'expected_result': [
-                    Branch('main', '0928jlskdfj'),
-                    Branch('iss76', 'kjsadfwi')
-                ]
+            [('Some code 3', FILE_URLS[2])],
+            [call(FILE_URLS[2])],
+            [
+                ('Some code 1', FILE_URLS[0]),
+                ('Some code 2', FILE_URLS[1]),
+                ('Some code 3', FILE_URLS[2]),
+            ],
+        ),
+    ]
+)
+def test_get_files_from_urls(mocker: MockerFixture, parser, token_parser, token,
+                             send_rv, get_file_rvs, get_file_calls, expected_result):
+    mock_send_graphql_request = mocker.patch.object(
+        GitHubParser, 'send_graphql_request'
+    )
+    mock_get_file_from_url = mocker.patch.object(GitHubParser, 'get_file_from_url')
+    parser = token_parser if token else parser
+    mock_send_graphql_request.return_value = send_rv
+    mock_get_file_from_url.side_effect = get_file_rvs
+
+    rv = parser.get_files_from_urls(FILE_URLS)
+    assert rv == expected_result
+    assert_calls(mock_get_file_from_url, get_file_calls)
+    if token:
+        mock_send_graphql_request.assert_called_once()
+        query = mock_send_graphql_request.call_args.args[0]
+        assert query.count('repository(') == 2
+        assert '"main:src/big.py"' in query
+    else:
+        mock_send_graphql_request.assert_not_called()
+
+
+def test_get_files_from_urls_batches(mocker: MockerFixture, token_parser):
+    mock_send_graphql_request = mocker.patch.object(
+        GitHubParser, 'send_graphql_request'
+    )
+    mock_get_file_from_url = mocker.patch.object(GitHubParser, 'get_file_from_url')
+    mock_logger = mocker.patch.object(token_parser, 'logger')
+    file_urls = [
+        f'https://github.com/OSLL/code-plagiarism/blob/main/src/module{i}.py'
+        for i in range(250)
+    ]
+
+    def send_graphql_request(query):
+        files = re.findall(r'f(\d+): object', query)
+        if len(files) < 100:
+            return {'data': None, 'errors': [{'message': 'Something went wrong'}]}
+
+        return {
+            'data': {'r0': {f'f{i}': make_blob(f'Some code {i}') for i in files}}
+        }
+
+    mock_send_graphql_request.side_effect = send_graphql_request
+    mock_get_file_from_url.side_effect = lambda file_url: ('Some REST code', file_url)
+
+    rv = token_parser.get_files_from_urls(file_urls)
+
+    assert rv == [
+        (f'Some code {i}', file_url) for i, file_url in enumerate(file_urls[:200])
+    ] + [('Some REST code', file_url) for file_url in file_urls[200:]]
+    assert [
+        graphql_call.args[0].count('object(')
+        for graphql_call in mock_send_graphql_request.call_args_list
+    ] == [100, 100, 50]
+    assert mock_get_file_from_url.call_count == 50
+    mock_logger.debug.assert_called_once()
+
+
+def test_get_files_from_urls_incomplete_blobs(mocker: MockerFixture, token_parser):
+    mock_send_graphql_request = mocker.patch.object(
+        GitHubParser, 'send_graphql_request'
+    )
+    mock_get_file_from_url = mocker.patch.object(GitHubParser, 'get_file_from_url')
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    mock_send_graphql_request.return_value = {
+        'data': {
+            'r0': {
+                'f0': make_blob('Some code 1'),
+                'f2': make_blob('Beginning of code 3', 'sha3', is_truncated=True)
             },
+            'r1': {'f1': make_blob(None, 'sha2', is_binary=True)}
+        }
+    }
+    mock_get_file_content_from_sha.side_effect = (
+        lambda owner, repo, sha, link: (f'Raw {sha}', link)
+    )
+
+    rv = token_parser.get_files_from_urls(FILE_URLS)
+
+    assert rv == [
+        ('Some code 1', FILE_URLS[0]),
+        ('Raw sha2', FILE_URLS[1]),
+        ('Raw sha3', FILE_URLS[2]),
+    ]
+    query = mock_send_graphql_request.call_args.args[0]
+    assert '{ ... on Blob { oid text isTruncated isBinary } }' in query
+    assert_calls(
+        mock_get_file_content_from_sha,
+        [
+            call('OSLL', 'aido-auto-feedback', 'sha2', FILE_URLS[1]),
+            call('OSLL', 'code-plagiarism', 'sha3', FILE_URLS[2]),
         ]
+    )
+    mock_get_file_from_url.assert_not_called()
+
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_send_get_request.reset_mock()
-            mock_send_get_request.side_effect = test_case['send_se']
-
-            buf = io.StringIO()
-            with redirect_stdout(buf), self.subTest(test_case=test_case):
-                rv = parser.get_list_repo_branches(**test_case['arguments'])
-                self.assertEqual(rv, test_case['expected_result'])
-
-                self.assertEqual(mock_send_get_request.mock_calls, test_case['send_calls'])
-
-    @patch('webparsers.github_parser.GitHubParser.get_name_default_branch')
-    @patch('webparsers.github_parser.GitHubParser.get_list_repo_branches')
-    @patch('webparsers.github_parser.GitHubParser.get_sha_last_branch_commit')
-    @patch('webparsers.github_parser.GitHubParser.get_files_generator_from_sha_commit')
-    def test_get_files_generator_from_repo_url(self, mock_get_files_generator_from_sha_commit,
-                                               mock_get_sha_last_branch_commit,
-                                               mock_get_list_repo_branches,
-                                               mock_get_name_default_branch):
-        test_cases = [
+@pytest.mark.parametrize(
+    "arguments, send_rv, files_gen, file_gen, expected_result",
+    [
+        (
             {
-                'check_all': 0,
-                'arguments': {
-                    'repo_url': 'https://github.com/OSLL/code-plagiarism',
-                },
-                'name_default_branch': 'iss76',
-                'branch_sha': 'uixbwupreiljlsdf',
-                'branches': None,
-                'files': [('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py')],
-                'expected_result': [
-                    ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
-                ]
+                'dir_url': 'https://github.com/OSLL/code-plagiarism/tree/main/src'
             },
-            {
-                'check_all': 1,
-                'arguments': {
-                    'repo_url': 'https://github.com/OSLL/code-plagiarism',
-                },
-                'name_default_branch': None,
-                'branch_sha': None,
-                'branches': [
-                    Branch('master', 'iobiqirsad'),
-                    Branch('iss76', 'iobxzewqrsf')
-                ],
-                'files': [('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py')],
-                'expected_result': [
-                    ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
-                    ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py')
+            make_response(
+                [
+                    {
+                        'path': 'src',
+                        'type': 'dir',
+                        'sha': 'xvbupqrjdf',
+                    },
+                    {
+                        'path': 'src',
+                        'name': 'main.py',
+                        'type': 'file',
+                        'sha': 'iouxpoewre',
+                    }
                 ]
-            },
-        ]
+            ),
+            ['dummy 1', 'dummy 2'],
+            'dummy 3',
+            ['dummy 1', 'dummy 2', 'dummy 3'],
+        ),
+    ]
+)
+def test_get_files_generator_from_dir_url(mocker: MockerFixture, parser, arguments,
+                                          send_rv, files_gen, file_gen,
+                                          expected_result):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_get_files_generator_from_sha_commit = mocker.patch.object(
+        GitHubParser, 'get_files_generator_from_sha_commit'
+    )
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    mock_send_get_request.return_value = send_rv
+    mock_get_files_generator_from_sha_commit.return_value = files_gen
+    mock_get_file_content_from_sha.return_value = file_gen
+
+    rv = list(parser.get_files_generator_from_dir_url(**arguments))
+    assert rv == expected_result
 
-        for test_case in test_cases:
-            parser = GitHubParser(check_all=test_case['check_all'])
-            mock_get_files_generator_from_sha_commit.reset_mock()
-            mock_get_list_repo_branches.reset_mock()
-            mock_get_sha_last_branch_commit.reset_mock()
-            mock_get_name_default_branch.reset_mock()
-
-            mock_get_name_default_branch.return_value = test_case['name_default_branch']
-            mock_get_sha_last_branch_commit.return_value = test_case['branch_sha']
-            mock_get_files_generator_from_sha_commit.return_value = test_case['files']
-            mock_get_list_repo_branches.return_value = test_case['branches']
-
-            with self.subTest(test_case=test_case):
-                rv = list(parser.get_files_generator_from_repo_url(**test_case['arguments']))
-                self.assertEqual(rv, test_case['expected_result'])
-
-    @patch('webparsers.github_parser.GitHubParser.get_file_content_from_sha')
-    @patch('webparsers.github_parser.GitHubParser.send_get_request')
-    def test_get_file_from_url(self, mock_send_get_request,
-                               mock_get_file_content_from_sha):
-        test_cases = [
+
+def test_get_files_generator_from_dir_url_files(mocker: MockerFixture, parser):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    names = [f'module{i}.py' for i in range(20)]
+    mock_send_get_request.return_value = make_response(
+        [
             {
-                'arguments': {
-                    'file_url': 'https://github.com/OSLL/code-plagiarism/blob/main/src/codeplag/astfeatures.py'
-                },
-                'send_rv': Response({'sha': 'ioujxbwurqer'}),
-                'get_file_content_rv': ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
-                'expected_result': ('Some code 1', 'https://github.com/OSLL/aido-auto-feedback/blob/iss76/main.py'),
+                'path': f'src/{name}',
+                'name': name,
+                'type': 'file',
+                'sha': f'sha{i}',
             }
+            for i, name in enumerate(names)
         ]
+    )
+    mock_get_file_content_from_sha.side_effect = (
+        lambda owner, repo, sha, link: (sha, link)
+    )
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_send_get_request.return_value = test_case['send_rv']
-            mock_get_file_content_from_sha.return_value = test_case['get_file_content_rv']
-
-            with self.subTest(test_case=test_case):
-                rv = parser.get_file_from_url(**test_case['arguments'])
-                self.assertEqual(rv, test_case['expected_result'])
-
-    @patch('webparsers.github_parser.GitHubParser.get_file_content_from_sha')
-    @patch('webparsers.github_parser.GitHubParser.get_files_generator_from_sha_commit')
-    @patch('webparsers.github_parser.GitHubParser.send_get_request')
-    def test_get_files_generator_from_dir_url(self, mock_send_get_request,
-                                              mock_get_files_generator_from_sha_commit,
-                                              mock_get_file_content_from_sha):
-        test_cases = [
+    rv = list(
+        parser.get_files_generator_from_dir_url(
+            'https://github.com/OSLL/code-plagiarism/tree/main/src'
+        )
+    )
+
+    assert [sha for sha, _ in rv] == [f'sha{i}' for i in range(len(names))]
+    assert_calls_in_any_order(
+        mock_get_file_content_from_sha,
+        [call('OSLL', 'code-plagiarism', sha, link) for sha, link in rv]
+    )
+
+
+def test_get_files_generator_from_dir_url_streaming(mocker: MockerFixture, parser):
+    mock_send_get_request = mocker.patch.object(GitHubParser, 'send_get_request')
+    mock_get_file_content_from_sha = mocker.patch.object(
+        GitHubParser, 'get_file_content_from_sha'
+    )
+    mock_send_get_request.return_value = make_response(
+        [
             {
-                'arguments': {
-                    'dir_url': 'https://github.com/OSLL/code-plagiarism/tree/main/src'
-                },
-                'send_rv': Response(
-                    [
-                        {
-                            'path': 'src',
-                            'type': 'dir',
-                            'sha': 'xvbupqrjdf',
-                        },
-                        {
-                            'path': 'src',
-                            'name': 'main.py',
-                            'type': 'file',
-                            'sha': 'iouxpoewre',
-                        }
-                    ]
-                ),
-                'files_gen': ['dummy 1', 'dummy 2'],
-                'file_gen': 'dummy 3',
-                'expected_result': ['dummy 1', 'dummy 2', 'dummy 3']
+                'path': f'src/module{i}.py',
+                'name': f'module{i}.py',
+                'type': 'file',
+                'sha': f'sha{i}',
             }
+            for i in range(50)
         ]
+    )
+    mock_get_file_content_from_sha.side_effect = (
+        lambda owner, repo, sha, link: sha
+    )
+    spy_submit = mocker.spy(ThreadPoolExecutor, 'submit')
+
+    gen = parser.get_files_generator_from_dir_url(
+        'https://github.com/OSLL/code-plagiarism/tree/main/src'
+    )
+    assert next(gen) == 'sha0'
+    # Only the window of the files is requested before they are consumed
+    assert spy_submit.call_count == github_parser._BLOBS_WINDOW
+
+    assert list(gen) == [f'sha{i}' for i in range(1, 50)]
+    assert spy_submit.call_count == 50
+
+
+def test_send_get_request_not_cached(mocker: MockerFixture, parser):
+    mock_get = mocker.patch.object(requests.Session, 'get')
+    mock_get.return_value = make_response({'default_branch': 'main'})
+
+    parser.send_get_request('/repos/OSLL/code-plagiarism')
+    parser.send_get_request('/repos/OSLL/code-plagiarism')
+
+    assert mock_get.call_count == 2
+
+
+def test_get_json_cached(mocker: MockerFixture, parser):
+    mock_get = mocker.patch.object(requests.Session, 'get')
+    mock_get.return_value = make_response({'default_branch': 'main'})
+
+    first_rv = parser.get_json('/repos/OSLL/code-plagiarism')
+    second_rv = parser.get_json('/repos/OSLL/code-plagiarism')
+    parser.get_json('/repos/OSLL/code-plagiarism', params={'page': 2})
+
+    assert first_rv == {'default_branch': 'main'}
+    assert second_rv is first_rv
+    assert mock_get.mock_calls == [
+        call('https://api.github.com/repos/OSLL/code-plagiarism', params={}),
+        call(
+            'https://api.github.com/repos/OSLL/code-plagiarism',
+            params={'page': 2}
+        ),
+    ]
+
+
+def test_get_json_expired(mocker: MockerFixture, parser):
+    mock_get = mocker.patch.object(requests.Session, 'get')
+    mock_monotonic = mocker.patch.object(github_parser.time, 'monotonic')
+    mock_get.return_value = make_response(
+        {'default_branch': 'main'}, etag='"etag"'
+    )
+    mock_monotonic.side_effect = [0.0, 1000.0, 1000.0]
+
+    parser.get_json('/repos/OSLL/code-plagiarism')
+    parser.get_json('/repos/OSLL/code-plagiarism')
+
+    assert mock_get.mock_calls == [
+        call('https://api.github.com/repos/OSLL/code-plagiarism', params={}),
+        call(
+            'https://api.github.com/repos/OSLL/code-plagiarism',
+            params={},
+            headers={'If-None-Match': '"etag"'}
+        ),
+    ]
 
-        parser = GitHubParser()
-        for test_case in test_cases:
-            mock_send_get_request.return_value = test_case['send_rv']
-            mock_get_files_generator_from_sha_commit.return_value = test_case['files_gen']
-            mock_get_file_content_from_sha.return_value = test_case['file_gen']
 
-            with self.subTest(test_case=test_case):
-                rv = list(parser.get_files_generator_from_dir_url(**test_case['arguments']))
-                self.assertEqual(rv, test_case['expected_result'])
+def test_get_json_not_modified(mocker: MockerFixture, parser):
+    mock_get = mocker.patch.object(requests.Session, 'get')
+    mock_monotonic = mocker.patch.object(github_parser.time, 'monotonic')
+    mock_get.side_effect = [
+        make_response({'default_branch': 'main'}, etag='"etag"'),
+        make_response(status=304),
+    ]
+    mock_monotonic.side_effect = [0.0, 1000.0, 1000.0]
 
+    first_rv = parser.get_json('/repos/OSLL/code-plagiarism')
+    second_rv = parser.get_json('/repos/OSLL/code-plagiarism')
 
-if __name__ == '__main__':
-    unittest.main()
+    assert first_rv == {'default_branch': 'main'}
+    assert second_rv is first_rv
+    assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"etag"'}